@@ -1 +1,12 @@
-from .client import Client
+"""Importing the package is free, the client (and aiohttp along with it) is only
+imported the first time `Client` is used..."""
+
+__all__ = ["Client"]
+
+
+def __getattr__(name: str):
+    if name == "Client":
+        from .client import Client
+
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
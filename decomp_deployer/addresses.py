@@ -0,0 +1,113 @@
+"""Sorted tables of every binding address for each platform so that an address
+can be turned back into the function it belongs to with a binary search instead
+of grepping through broma. The tables are collected while the writer walks the
+bindings and are saved as json next to `symbols.db` (and as a C++ header in the
+tree) for the `lookup` command...
+
+    decomp-deploy lookup 0x1234ab --platform win
+"""
+
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .model import PLATFORMS, Class, FunctionBindField
+from .output import atomic_write
+
+# Bump this whenever the json below changes
+ADDRESSES_VERSION = 1
+
+ADDRESSES_FILE = "addresses.json"
+
+
+class AddressTable:
+    """The addresses of a single platform, the addresses are kept sorted in an
+    array of unsigned 64 bit ints with the symbols in a list next to them"""
+
+    __slots__ = ("addresses", "symbols")
+
+    def __init__(self, bindings: list[tuple[int, str]] = ()) -> None:
+        bindings = sorted(bindings)
+        self.addresses = array("Q", [a for a, _ in bindings])
+        self.symbols = [s for _, s in bindings]
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return zip(self.addresses, self.symbols)
+
+    def exact(self, address: int) -> list[str]:
+        """Every symbol bound at exactly `address`"""
+        start = bisect_left(self.addresses, address)
+        end = bisect_right(self.addresses, address, start)
+        return self.symbols[start:end]
+
+    def lookup(self, address: int) -> Optional[tuple[int, str]]:
+        """The closest symbol at or below `address` and where it starts. The size
+        of functions isn't known so anything past the last one still lands on it"""
+        i = bisect_right(self.addresses, address)
+        if not i:
+            return None
+        return self.addresses[i - 1], self.symbols[i - 1]
+
+
+class AddressIndex:
+    """Collects the binding addresses of every class the writer walks over and
+    saves them to `path` when closed"""
+
+    def __init__(self, path: Union[str, Path] = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.bindings: dict[str, list[tuple[int, str]]] = {}
+
+    def add_class(self, node: Class):
+        for field in node.fields:
+            if type(field) is FunctionBindField:
+                symbol = node.name + "::" + field.prototype.name
+                for platform, address in field.binds:
+                    self.bindings.setdefault(platform, []).append((address, symbol))
+
+    def tables(self) -> dict[str, AddressTable]:
+        return {p: AddressTable(self.bindings[p]) for p in PLATFORMS if p in self.bindings}
+
+    def close(self):
+        if self.path is not None:
+            atomic_write(self.path, dump_tables(self.tables()).encode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def dump_tables(tables: dict[str, AddressTable]) -> str:
+    """Addresses are written as hex since that's how everyone reads them"""
+    return json.dumps(
+        {
+            "version": ADDRESSES_VERSION,
+            "platforms": {p: [[hex(a), s] for a, s in table] for p, table in tables.items()},
+        },
+        separators=(",", ":"),
+    )
+
+
+def load_tables(path: Union[str, Path]) -> dict[str, AddressTable]:
+    """Loads the tables saved by `AddressIndex`, raises ValueError if they were
+    made by an older version of the generator"""
+    if not Path(path).exists():
+        raise FileNotFoundError(f"{path} is missing, the decomp environment needs to be built first")
+    with open(path, "r", encoding="utf-8") as r:
+        data = json.load(r)
+    if data.get("version") != ADDRESSES_VERSION:
+        raise ValueError(f"{path} was made by an older version of the generator")
+
+    tables = {}
+    for platform, bindings in data["platforms"].items():
+        # Already sorted when saved, the array is filled directly instead of sorting again
+        table = tables[platform] = AddressTable()
+        table.addresses = array("Q", [int(a, 16) for a, _ in bindings])
+        table.symbols = [s for _, s in bindings]
+    return tables
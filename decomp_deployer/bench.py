@@ -0,0 +1,595 @@
+"""Offline benchmarks for the generator and the downloader. Everything runs against
+the vendored snapshot of the bindings in `data/snapshot` (served from a local
+stand-in server for the downloads) and the generator writes into memory so that
+the numbers are comparable between commits and machines with slow disks...
+
+    decomp-deploy bench generator --rounds 10 --json after.json --compare before.json
+    decomp-deploy bench download --concurrency 1 --concurrency 4 --latency 0.05
+    decomp-deploy bench startup --budget 100
+    decomp-deploy bench parser --rounds 10
+    decomp-deploy bench memory --budget parse=40 --budget write_everything=120
+
+The writer and the client are only imported by the benchmarks that need them so
+that having `bench` in the cli doesn't slow down it's startup
+"""
+
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+import asyncclick as click
+
+from .model import PARSERS, default_parser
+from .resources import SNAPSHOT
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .model import Class
+    from .standin import StandInServer
+    from .writer import ClassHeadersWriter
+
+# Commands that should start fast, none of them need the network or the writer
+STARTUP_COMMANDS = {
+    "--help": ["-m", "decomp_deployer", "--help"],
+    "generate --help": ["-m", "decomp_deployer", "generate", "--help"],
+    "symbols --help": ["-m", "decomp_deployer", "symbols", "--help"],
+}
+
+# Modules (and everything in them) that have no business being imported just to print some help...
+STARTUP_FORBIDDEN = (
+    "aiohttp",
+    "aiohttp_socks",
+    "aiofiles",
+    "pybroma",
+    "Cython",
+    "sqlite3",
+    "tarfile",
+    "zipfile",
+    "decomp_deployer.bench",
+    "decomp_deployer.client",
+    "decomp_deployer.output",
+    "decomp_deployer.writer",
+)
+
+# What every command pays before any of our code runs, the cli can't start faster than this
+STARTUP_FLOOR = ["-c", "import asyncclick, asyncio"]
+
+# Milliseconds a command may take to start on top of the floor before `bench startup` fails,
+# it's measured against the floor so that it means the same on a slow machine
+STARTUP_OVERHEAD_BUDGET = 40.0
+
+
+def git_commit() -> Optional[str]:
+    """The commit being benchmarked, if we happen to be inside of a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(func: Callable[[], dict], rounds: int) -> dict:
+    """Runs `func` a number of times, `func` returns the amount of work it did
+    (classes and bytes) so that we can turn the timings into throughput"""
+    timings = []
+    work = {}
+    for _ in range(rounds):
+        start = time.perf_counter()
+        work = func()
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    result = {
+        "rounds": rounds,
+        "min": best,
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+    }
+    if work.get("classes"):
+        result["classes_per_sec"] = work["classes"] / best
+    if work.get("bytes"):
+        result["mb_per_sec"] = work["bytes"] / best / 1_000_000
+    result.update(work)
+    return result
+
+
+def bench_parse(path: str, parser: str = None):
+    from .model import parse_bindings
+
+    return {"classes": len(parse_bindings(path, parser)), "bytes": os.path.getsize(path)}
+
+
+def bench_visit(classes: "list[Class]"):
+    from .output import MemoryOutput
+    from .writer import ClassHeadersWriter
+
+    chw = ClassHeadersWriter(MemoryOutput())
+    chw.start(classes)
+    return {"classes": len(chw.classes), "bytes": chw.output.bytes_written}
+
+
+def bench_write_contents(chw: "ClassHeadersWriter"):
+    size = 0
+    for source in chw.classes:
+        size += len(source.write_contents())
+    return {"classes": len(chw.classes), "bytes": size}
+
+
+def bench_write_includes(chw: "ClassHeadersWriter"):
+    from .output import MemoryOutput
+
+    chw.output = MemoryOutput()
+    chw.write_includes()
+    return {"classes": len(chw.classes) + len(chw.delegates), "bytes": chw.output.bytes_written}
+
+
+def bench_write_everything(snapshot: Path, parser: str = None):
+    from .output import MemoryOutput
+    from .writer import write_everything
+
+    output = MemoryOutput()
+    write_everything(output=output, bindings=snapshot, parser=parser)
+    # headers + sources, the rest is includes.h and the vscode config...
+    return {"classes": sum(f.startswith("src/") for f in output.files), "bytes": output.bytes_written}
+
+
+def run(rounds: int = 5, snapshot: Path = SNAPSHOT, parser: str = None) -> dict:
+    """Runs all the benchmarks and returns a json serializable report"""
+    from .model import parse_bindings
+    from .output import MemoryOutput
+    from .writer import ClassHeadersWriter, concat_bindings
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # write_everything drops `_temp.bro` into the working directory...
+        os.chdir(tmp)
+        try:
+            concat_bindings(snapshot, "snapshot.bro")
+            classes = parse_bindings("snapshot.bro", parser)
+            chw = ClassHeadersWriter(MemoryOutput())
+            chw.start(classes)
+
+            benchmarks = {
+                "parse": measure(lambda: bench_parse("snapshot.bro", parser), rounds),
+                "visit": measure(lambda: bench_visit(classes), rounds),
+                "write_contents": measure(lambda: bench_write_contents(chw), rounds),
+                "write_includes": measure(lambda: bench_write_includes(chw), rounds),
+                "write_everything": measure(lambda: bench_write_everything(snapshot, parser), rounds),
+            }
+        finally:
+            os.chdir(cwd)
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "snapshot": str(snapshot),
+        "parser": parser or default_parser(),
+        "benchmarks": benchmarks,
+    }
+
+
+def percentile(timings: list[float], p: float) -> float:
+    timings = sorted(timings)
+    return timings[min(len(timings) - 1, round(p / 100 * (len(timings) - 1)))]
+
+
+async def bench_download_files(client: "Client", server: "StandInServer", paths: list[str]) -> list[float]:
+    """Downloads every path through `downloadFile` and returns how long each one took"""
+
+    async def timed(path: str):
+        start = time.perf_counter()
+        await client.downloadFile(str(server.url / path), path.replace("/", "_"))
+        return time.perf_counter() - start
+
+    return list(await asyncio.gather(*[timed(p) for p in paths]))
+
+
+async def run_download(
+    concurrency: tuple[int, ...] = (1, 2, 4, 8),
+    rounds: int = 3,
+    files: int = 24,
+    size: int = 256 * 1024,
+    latency: float = 0.02,
+    bandwidth: Optional[int] = None,
+    error_rate: float = 0.0,
+) -> dict:
+    """Measures throughput and tail latency of `downloadBindings` and `downloadFile`
+    against the local stand-in for every concurrency limit"""
+    from .client import Client
+    from .standin import StandInServer, synthetic_bindings
+
+    payload = synthetic_bindings("bench", size)
+    data = b"".join(payload.values())
+    # a bunch of extra files so that concurrency limits actually matter...
+    for i in range(files):
+        payload[f"files/{i}.bro"] = data[:size]
+
+    results = {}
+    cwd = os.getcwd()
+    async with StandInServer(payload, latency=latency, bandwidth=bandwidth, error_rate=error_rate, seed=0) as server:
+        with tempfile.TemporaryDirectory() as tmp:
+            # the client keeps its downloads in `.temp` of the working directory
+            os.chdir(tmp)
+            try:
+                for limit in concurrency:
+                    timings = []
+                    walls = []
+                    bindings = []
+                    downloaded = 0
+                    for _ in range(rounds):
+                        async with Client(concurrency=limit, bindings_url=server.url / "bindings") as client:
+                            start = time.perf_counter()
+                            await client.downloadBindings("bench")
+                            bindings.append(time.perf_counter() - start)
+
+                            start = time.perf_counter()
+                            timings += await bench_download_files(client, server, [f"files/{i}.bro" for i in range(files)])
+                            walls.append(time.perf_counter() - start)
+                            downloaded = client.bytes_downloaded
+                        # No conditional requests between rounds, we want full transfers
+                        for leftover in Path(".temp").iterdir():
+                            leftover.unlink()
+
+                    results[str(limit)] = {
+                        "rounds": rounds,
+                        "bytes_per_round": downloaded,
+                        "bindings_min": min(bindings),
+                        "files_min": min(walls),
+                        "mb_per_sec": downloaded / (min(bindings) + min(walls)) / 1_000_000,
+                        "p50": percentile(timings, 50),
+                        "p95": percentile(timings, 95),
+                        "p99": percentile(timings, 99),
+                    }
+            finally:
+                os.chdir(cwd)
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "latency": latency,
+        "bandwidth": bandwidth,
+        "error_rate": error_rate,
+        "files": files,
+        "size": size,
+        "concurrency": results,
+    }
+
+
+def importtime(argv: list[str]) -> dict[str, int]:
+    """Runs a command under `python -X importtime` and returns the cumulative
+    import time (in microseconds) of every module it imported"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def run_startup(rounds: int = 5) -> dict:
+    """Wall time of starting every command in `STARTUP_COMMANDS` along with the
+    imports that cost the most and any forbidden ones that snuck in. `overhead`
+    is how much slower than just starting asyncclick (`floor`) it is"""
+
+    commands = {"": STARTUP_FLOOR, **STARTUP_COMMANDS}
+    timings: dict[str, list[float]] = {name: [] for name in commands}
+    # Taking turns keeps whatever else the machine is doing from landing on a single command
+    for _ in range(rounds):
+        for name, argv in commands.items():
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *argv], cwd=Path(__file__).parent.parent, capture_output=True, check=True)
+            timings[name].append(time.perf_counter() - start)
+
+    # Medians, a single lucky run of the floor would make every command look slow
+    floor = statistics.median(timings.pop(""))
+    results = {}
+    for name, argv in STARTUP_COMMANDS.items():
+        imports = importtime(argv)
+        results[name] = {
+            "rounds": rounds,
+            "min": min(timings[name]),
+            "overhead": statistics.median(timings[name]) - floor,
+            "median": statistics.median(timings[name]),
+            "modules": len(imports),
+            "slowest": dict(sorted(imports.items(), key=lambda i: i[1], reverse=True)[:5]),
+            "forbidden": sorted(m for m in imports if m in STARTUP_FORBIDDEN or m.startswith(tuple(f + "." for f in STARTUP_FORBIDDEN))),
+        }
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "floor": floor,
+        "commands": results,
+    }
+
+
+def diff_models(expected: "list[Class]", actual: "list[Class]") -> list[str]:
+    """Everything that differs between two models of the same bindings"""
+    differences = []
+    if [c.name for c in expected] != [c.name for c in actual]:
+        differences.append("classes are missing or out of order")
+    theirs = {c.name: c for c in actual}
+    for c in expected:
+        other = theirs.get(c.name)
+        if other is None or other == c:
+            continue
+        if other.superclasses != c.superclasses:
+            differences.append(f"{c.name}: superclasses {c.superclasses} != {other.superclasses}")
+        for i, (a, b) in enumerate(zip(c.fields, other.fields)):
+            if a != b:
+                differences.append(f"{c.name}: field {i} {a} != {b}")
+        if len(c.fields) != len(other.fields):
+            differences.append(f"{c.name}: {len(c.fields)} fields != {len(other.fields)}")
+    return differences
+
+
+def run_parsers(rounds: int = 5, snapshot: Path = SNAPSHOT) -> dict:
+    """Times every installed parser over the snapshot and checks that the built-in
+    parser makes the same model and writes the same files as pybroma"""
+    from importlib.util import find_spec
+
+    from .model import parse_bindings
+    from .output import MemoryOutput
+    from .writer import concat_bindings, write_everything
+
+    parsers = [p for p in PARSERS if p != "pybroma" or find_spec("pybroma") is not None]
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            concat_bindings(snapshot, "snapshot.bro")
+            benchmarks = {p: measure(lambda: bench_parse("snapshot.bro", p), rounds) for p in parsers}
+
+            differences = None
+            if "pybroma" in parsers:
+                differences = diff_models(parse_bindings("snapshot.bro", "pybroma"), parse_bindings("snapshot.bro", "python"))
+                outputs = {}
+                for p in parsers:
+                    outputs[p] = MemoryOutput()
+                    write_everything(output=outputs[p], bindings=snapshot, parser=p)
+                for name in sorted(outputs["pybroma"].files.keys() | outputs["python"].files.keys()):
+                    if outputs["pybroma"].files.get(name) != outputs["python"].files.get(name):
+                        differences.append(f"{name} is written differently")
+        finally:
+            os.chdir(cwd)
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "snapshot": str(snapshot),
+        "benchmarks": benchmarks,
+        # None when pybroma isn't installed and there's nothing to compare against
+        "differences": differences,
+    }
+
+
+def run_memory(snapshot: Path = SNAPSHOT, parser: str = None, top: int = 10) -> dict:
+    """Generates the snapshot into a temporary directory under tracemalloc and
+    returns the peak and retained memory of every phase, along with the `top`
+    places that still held on to memory once generation was over. Memory
+    pybroma allocates on the C++ side isn't seen by tracemalloc"""
+    import gc
+    import tracemalloc
+
+    from .output import DirectoryOutput
+    from .profiling import Profiler
+    from .writer import write_everything
+
+    def generate(tmp: Path, profiler: Profiler = None):
+        # A real directory along with the indexes, the same as a normal generate
+        with DirectoryOutput(tmp / "out") as output:
+            write_everything(output=output, profiler=profiler, bindings=snapshot, symbols=tmp / "symbols.db", work_dir=tmp, parser=parser, addresses=tmp / "addresses.json")
+
+    profiler = Profiler()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        # Once without tracing so that lazy imports and caches that are filled once aren't counted
+        generate(tmp)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            with profiler.phase("write_everything"):
+                generate(tmp, profiler)
+            # Cycles that are garbage already aren't being held by anyone
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    retained = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    held = [s for s in retained if s.size_diff > 0]
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "snapshot": str(snapshot),
+        "parser": parser or default_parser(),
+        "phases": {name: {"peak": p["peak"], "retained": p["retained"]} for name, p in profiler.phases.items()},
+        # What's still held once generation is over, anything here is a leak or a cache
+        "retained": sum(s.size_diff for s in retained),
+        "retained_by": [{"where": str(s.traceback[0]), "size": s.size_diff} for s in held[:top]],
+    }
+
+
+def parse_budgets(budgets: tuple[str, ...]) -> dict[str, float]:
+    """`parse=40` pairs into phase -> MiB"""
+    parsed = {}
+    for budget in budgets:
+        name, _, mib = budget.partition("=")
+        try:
+            parsed[name] = float(mib)
+        except ValueError:
+            raise click.BadParameter(f"{budget!r} should look like parse=40", param_hint="--budget")
+    return parsed
+
+
+def compare(before: dict, after: dict):
+    """Prints how much faster (or slower) every benchmark got"""
+    click.echo(f"{'benchmark':<20} {'before':>12} {'after':>12} {'speedup':>9}")
+    for name, result in after["benchmarks"].items():
+        old = before["benchmarks"].get(name)
+        if old is None:
+            continue
+        click.echo(f"{name:<20} {old['min'] * 1000:>10.2f}ms {result['min'] * 1000:>10.2f}ms {old['min'] / result['min']:>8.2f}x")
+
+
+@click.group()
+def cli():
+    """Offline benchmarks of the generator, the downloader and startup"""
+
+
+@cli.command()
+@click.option("--rounds", "-r", default=5, help="How many times each benchmark is repeated, the fastest round is what counts")
+@click.option("--snapshot", "-s", default=str(SNAPSHOT), help="Directory holding the Cocos2d, GeometryDash and Extras broma files")
+@click.option("--json", "json_path", default=None, help="Saves the results so that they can be compared against later")
+@click.option("--compare", "compare_path", default=None, help="Previous results to compare this run against")
+@click.option("--parser", type=click.Choice(PARSERS), default=None, help="Parser the bindings are parsed with, pybroma if it's installed by default")
+def generator(rounds: int, snapshot: str, json_path: str, compare_path: str, parser: str):
+    """Benchmarks visiting and writing the snapshot bindings into memory"""
+    results = run(rounds, Path(snapshot).resolve(), parser)
+    for name, result in results["benchmarks"].items():
+        click.echo(
+            f"{name:<20} {result['min'] * 1000:>10.2f}ms"
+            f" {result.get('classes_per_sec', 0):>12.0f} classes/s"
+            f" {result.get('mb_per_sec', 0):>8.2f} MB/s"
+        )
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as w:
+            json.dump(results, w, indent=4)
+    if compare_path:
+        with open(compare_path, "r", encoding="utf-8") as r:
+            compare(json.load(r), results)
+
+
+@cli.command()
+@click.option("--concurrency", "-c", multiple=True, type=int, default=(1, 2, 4, 8), help="Concurrency limits of the client to try, can be given more than once")
+@click.option("--rounds", "-r", default=3)
+@click.option("--files", default=24, help="Extra files downloaded through downloadFile on top of the bindings")
+@click.option("--size", default=256 * 1024, help="Size in bytes of every file being served")
+@click.option("--latency", default=0.02, help="Seconds the stand-in waits before answering")
+@click.option("--bandwidth", default=None, type=int, help="Bytes per second every response is throttled to")
+@click.option("--json", "json_path", default=None, help="Saves the results as json")
+async def download(concurrency: tuple[int, ...], rounds: int, files: int, size: int, latency: float, bandwidth: int, json_path: str):
+    """Benchmarks the Client against a local stand-in server"""
+    results = await run_download(concurrency, rounds, files, size, latency, bandwidth)
+    for limit, result in results["concurrency"].items():
+        click.echo(
+            f"concurrency {limit:>3} {result['mb_per_sec']:>8.2f} MB/s"
+            f" p50 {result['p50'] * 1000:>8.1f}ms p95 {result['p95'] * 1000:>8.1f}ms p99 {result['p99'] * 1000:>8.1f}ms"
+        )
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as w:
+            json.dump(results, w, indent=4)
+
+
+@cli.command()
+@click.option("--rounds", "-r", default=10)
+@click.option("--budget", default=None, type=float, help="Fails if any command takes longer than this many milliseconds to start")
+@click.option("--overhead-budget", default=STARTUP_OVERHEAD_BUDGET, type=float, show_default=True, help="Fails if any command takes this many milliseconds longer to start than asyncclick alone")
+@click.option("--json", "json_path", default=None, help="Saves the results as json")
+def startup(rounds: int, budget: float, overhead_budget: float, json_path: str):
+    """Checks how long the cli takes to start and that it doesn't import anything heavy it doesn't need"""
+    results = run_startup(rounds)
+    failed = []
+    click.echo(f"{'asyncclick':<16} {results['floor'] * 1000:>8.1f}ms median")
+    for name, result in results["commands"].items():
+        click.echo(f"{name:<16} {result['min'] * 1000:>8.1f}ms {result['modules']:>5} modules, {result['overhead'] * 1000:+.1f}ms over asyncclick")
+        for module, cumulative in result["slowest"].items():
+            click.echo(f"    {module:<30} {cumulative / 1000:>8.1f}ms")
+        if result["forbidden"]:
+            failed.append(f"{name} imported {', '.join(result['forbidden'])}")
+        if budget is not None and result["min"] * 1000 > budget:
+            failed.append(f"{name} took {result['min'] * 1000:.1f}ms which is over the {budget:.0f}ms budget")
+        if result["overhead"] * 1000 > overhead_budget:
+            failed.append(f"{name} took {result['overhead'] * 1000:.1f}ms longer than asyncclick alone which is over the {overhead_budget:.0f}ms budget")
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as w:
+            json.dump(results, w, indent=4)
+    if failed:
+        raise click.ClickException("\n".join(failed))
+
+
+@cli.command()
+@click.option("--rounds", "-r", default=5)
+@click.option("--snapshot", "-s", default=str(SNAPSHOT), help="Directory holding the Cocos2d, GeometryDash and Extras broma files")
+@click.option("--json", "json_path", default=None, help="Saves the results as json")
+def parser(rounds: int, snapshot: str, json_path: str):
+    """Races the built-in parser against pybroma and fails if their output differs"""
+    results = run_parsers(rounds, Path(snapshot).resolve())
+    for name, result in results["benchmarks"].items():
+        click.echo(f"{name:<10} {result['min'] * 1000:>10.2f}ms {result['classes_per_sec']:>12.0f} classes/s {result['mb_per_sec']:>8.2f} MB/s")
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as w:
+            json.dump(results, w, indent=4)
+    if results["differences"] is None:
+        click.echo("[!] pybroma isn't installed, only the built-in parser was timed")
+    elif results["differences"]:
+        raise click.ClickException("The parsers disagree:\n" + "\n".join(results["differences"]))
+    else:
+        click.echo("[+] Both parsers made the same model and wrote the same files")
+
+
+@cli.command()
+@click.option("--snapshot", "-s", default=str(SNAPSHOT), help="Directory holding the Cocos2d, GeometryDash and Extras broma files")
+@click.option("--parser", type=click.Choice(PARSERS), default=None, help="Parser the bindings are parsed with, pybroma if it's installed by default")
+@click.option("--budget", "budgets", multiple=True, help="Fails if a phase peaks over this many MiB, e.g. parse=40 or write_everything=120 for the whole run, can be given more than once")
+@click.option("--retained-budget", default=None, type=float, help="Fails if more than this many MiB are still held once generation is over")
+@click.option("--top", default=10, help="How many of the places still holding memory afterwards are shown")
+@click.option("--json", "json_path", default=None, help="Saves the results as json")
+def memory(snapshot: str, parser: str, budgets: tuple[str, ...], retained_budget: float, top: int, json_path: str):
+    """Measures peak and retained memory of every phase of generating the snapshot with tracemalloc"""
+    budget = parse_budgets(budgets)
+    results = run_memory(Path(snapshot).resolve(), parser, top)
+    phases = results["phases"]
+    if unknown := sorted(budget.keys() - phases.keys()):
+        raise click.BadParameter(f"No phase called {', '.join(unknown)}, there's {', '.join(phases)}", param_hint="--budget")
+
+    failed = []
+    for name, result in phases.items():
+        click.echo(f"{name:<20} peak {result['peak'] / 1024 / 1024:>8.2f}MiB retained {result['retained'] / 1024 / 1024:>8.2f}MiB")
+        if name in budget and result["peak"] / 1024 / 1024 > budget[name]:
+            failed.append(f"{name} peaked at {result['peak'] / 1024 / 1024:.2f}MiB which is over the {budget[name]:g}MiB budget")
+    if results["retained_by"]:
+        click.echo("still held afterwards by")
+        for site in results["retained_by"]:
+            click.echo(f"    {site['where']:<60} {site['size'] / 1024:>10.1f}KiB")
+    retained = results["retained"] / 1024 / 1024
+    click.echo(f"{'afterwards':<20} held {retained:>8.2f}MiB")
+    if retained_budget is not None and retained > retained_budget:
+        failed.append(f"{retained:.2f}MiB was still held after generating which is over the {retained_budget:g}MiB budget")
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as w:
+            json.dump(results, w, indent=4)
+    if failed:
+        raise click.ClickException("\n".join(failed))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,358 @@
+"""A pure python Broma parser for when pybroma isn't installed (it has to be
+compiled from git with Cython and a C++ compiler). The file is split up into
+tokens with a single regex and a small recursive descent parser turns them
+straight into the model, the same model `from_pybroma` makes out of pybroma's
+tree so the writers can't tell which of the two parsed the bindings...
+
+Only what the writers need is kept, attributes, docs and the bodies of inline
+functions are skipped over"""
+
+import re
+from pathlib import Path
+from typing import Iterator, Union
+
+from .model import (PLATFORMS, Class, FunctionBindField, FunctionProto,
+                    MemberField, PadField, Type)
+
+
+# Whitespace (\r included) and comments are eaten in front of every token
+TOKEN_RE = re.compile(
+    r"""
+    (?:\s+|//[^\n]*|/\*.*?\*/)*
+    (?:
+      (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+    | (?P<number>0[xX][0-9a-fA-F]+|\d+)
+    | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<punct>::|\[\[|\]\]|[^\s])
+    )
+    """,
+    re.S | re.X,
+)
+
+# Keywords that can end a type, an argument ending with one of these has no name
+TYPE_KEYWORDS = frozenset((
+    "void", "bool", "char", "short", "int", "long", "float", "double",
+    "signed", "unsigned", "const", "volatile", "struct", "class", "enum",
+    "wchar_t", "char16_t", "char32_t", "auto",
+))
+
+MODIFIERS = frozenset(("virtual", "static", "callback", "inline"))
+
+# Broma's way of saying the function is inlined on a platform, same as not having an address
+INLINE = -2
+
+EOF = "eof"
+
+
+class BromaError(ValueError):
+    pass
+
+
+def tokenize(code: str) -> tuple[list[str], list[str], list[int], list[int]]:
+    """Splits broma into the kind, text, start and end of every token. They are
+    kept in separate lists rather than objects because making an object per
+    token is most of what tokenizing would cost, the last token is always EOF"""
+    kinds, texts, starts, ends = [], [], [], []
+    for m in TOKEN_RE.finditer(code):
+        i = m.lastindex
+        kinds.append(m.lastgroup)
+        texts.append(m.group(i))
+        starts.append(m.start(i))
+        ends.append(m.end(i))
+    kinds.append(EOF)
+    texts.append("")
+    starts.append(len(code))
+    ends.append(len(code))
+    return kinds, texts, starts, ends
+
+
+class Parser:
+    def __init__(self, code: str, filename: str = "<broma>") -> None:
+        self.code = code
+        self.filename = filename
+        self.kinds, self.texts, self.starts, self.ends = tokenize(code)
+        self.pos = 0
+        # The same few hundred types are used over and over so share them like from_pybroma does...
+        self.types: dict[tuple[str, bool], Type] = {}
+
+    # -- Tokens
+
+    @property
+    def text(self) -> str:
+        return self.texts[self.pos]
+
+    @property
+    def at_end(self) -> bool:
+        return self.kinds[self.pos] is EOF
+
+    def advance(self) -> str:
+        text = self.texts[self.pos]
+        if self.kinds[self.pos] is not EOF:
+            self.pos += 1
+        return text
+
+    def accept(self, text: str) -> bool:
+        if self.texts[self.pos] == text:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, text: str):
+        if self.texts[self.pos] != text:
+            self.error(f"expected '{text}'")
+        self.pos += 1
+
+    def error(self, message: str):
+        if self.at_end:
+            raise BromaError(f"{self.filename}: {message} but the file ended")
+        line = self.code.count("\n", 0, self.starts[self.pos]) + 1
+        raise BromaError(f"{self.filename}:{line}: {message} but got '{self.text}'")
+
+    def source(self, start: int, end: int) -> str:
+        """The code that the tokens from `start` up to `end` were made from"""
+        return self.code[self.starts[start]:self.ends[end - 1]]
+
+    def skip_attributes(self):
+        while self.texts[self.pos] == "[[":
+            depth = 0
+            while True:
+                if self.at_end:
+                    self.error("expected ']]'")
+                text = self.advance()
+                if text == "[[":
+                    depth += 1
+                elif text == "]]":
+                    depth -= 1
+                    if not depth:
+                        break
+
+    def skip_body(self):
+        """Skips over a `{ ... }` block, what's in it is C++ we don't care about"""
+        self.expect("{")
+        depth = 1
+        while depth:
+            if self.at_end:
+                self.error("expected '}'")
+            text = self.advance()
+            if text == "{":
+                depth += 1
+            elif text == "}":
+                depth -= 1
+
+    def skip_directive(self):
+        """`#import` and friends run until the end of their line"""
+        end = self.code.find("\n", self.starts[self.pos])
+        if end < 0:
+            end = len(self.code)
+        while not self.at_end and self.starts[self.pos] < end:
+            self.pos += 1
+
+    def scan(self, stops: str) -> int:
+        """Moves forward to the first of `stops` that isn't nested inside of <> or (),
+        returns where it started from"""
+        start = pos = self.pos
+        kinds, texts = self.kinds, self.texts
+        depth = 0
+        while True:
+            kind = kinds[pos]
+            if kind == "punct":
+                text = texts[pos]
+                if not depth and text in stops:
+                    break
+                if text in "<(":
+                    depth += 1
+                elif text in ">)":
+                    depth -= 1
+            elif kind is EOF:
+                self.pos = pos
+                self.error(f"expected one of {' '.join(stops)}")
+            elif texts[pos] == "operator":
+                # operator==, operator() and so on, everything up to the arguments is the name
+                pos += 1
+                if texts[pos] == "(":
+                    pos += 1
+                while kinds[pos] is not EOF and texts[pos] != "(":
+                    pos += 1
+                break
+            pos += 1
+        self.pos = pos
+        return start
+
+    # -- Grammar
+
+    def type(self, start: int, end: int) -> Type:
+        is_struct = self.texts[start] == "struct"
+        if is_struct:
+            start += 1
+        key = (self.source(start, end) if start < end else "", is_struct)
+        if (cached := self.types.get(key)) is None:
+            cached = self.types[key] = Type(*key)
+        return cached
+
+    def name_start(self, start: int, end: int) -> int:
+        """Where the name at the end of the tokens from `start` up to `end` begins"""
+        texts = self.texts
+        for i in range(start, end):
+            if texts[i] == "operator":
+                return i
+        if end - 1 > start and texts[end - 2] == "~":
+            return end - 2
+        if self.kinds[end - 1] != "ident":
+            self.error("expected a name")
+        return end - 1
+
+    def platforms(self) -> tuple[tuple[str, int], ...]:
+        """`win 0x1234, imac 0x5678, ...` into (platform, value) pairs in PLATFORMS order"""
+        values = {}
+        while True:
+            platform = self.text
+            if self.kinds[self.pos] != "ident":
+                self.error("expected a platform")
+            if platform not in PLATFORMS:
+                self.error(f"unknown platform, expected one of {', '.join(PLATFORMS)}")
+            self.pos += 1
+            value = self.text
+            if self.kinds[self.pos] == "number":
+                values[platform] = int(value, 16) if value[:2] in ("0x", "0X") else int(value)
+            elif value == "inline":
+                values[platform] = INLINE
+            else:
+                self.error("expected an address")
+            self.pos += 1
+            if not self.accept(","):
+                break
+        return tuple((p, values[p]) for p in PLATFORMS if values.get(p, -1) >= 0)
+
+    def args(self) -> tuple[tuple[str, Type], ...]:
+        self.expect("(")
+        if self.accept(")"):
+            return ()
+        args: dict[str, Type] = {}
+        kinds, texts = self.kinds, self.texts
+        index = 0
+        while True:
+            start = self.scan(",)=")
+            end = self.pos
+            if start == end:
+                self.error("expected an argument")
+            if self.text == "=":
+                # Default values aren't part of the model
+                self.scan(",)")
+            last = texts[end - 1]
+            if (
+                end - start > 1
+                and kinds[end - 1] == "ident"
+                and last not in TYPE_KEYWORDS
+                and texts[end - 2] not in ("::", "struct", "enum", "class")
+            ):
+                args[last] = self.type(start, end - 1)
+            else:
+                # Unnamed arguments get named after their position the same way broma does it
+                args[f"p{index}"] = self.type(start, end)
+            index += 1
+            if self.advance() == ")":
+                return tuple(args.items())
+
+    def field(self) -> Union[FunctionBindField, MemberField, PadField]:
+        if self.accept("PAD"):
+            self.expect("=")
+            amount = self.platforms()
+            self.expect(";")
+            return PadField(amount)
+
+        modifiers = set()
+        while self.text in MODIFIERS:
+            modifiers.add(self.advance())
+
+        start = self.scan("(;[={")
+        end = self.pos
+        if start == end:
+            self.error("expected a field")
+        stop = self.text
+
+        if stop == "(":
+            split = self.name_start(start, end)
+            ret = self.type(start, split)
+            name = self.source(split, end)
+            args = self.args()
+            is_const = False
+            while self.kinds[self.pos] == "ident":
+                # const, override, noexcept...
+                is_const |= self.advance() == "const"
+            binds = ()
+            if self.accept("="):
+                binds = self.platforms()
+            if self.text == "{":
+                self.skip_body()
+            else:
+                self.expect(";")
+            return FunctionBindField(
+                FunctionProto(name, ret, args, "virtual" in modifiers, "static" in modifiers, is_const),
+                binds,
+            )
+
+        if stop == "{":
+            self.error("expected '(' or ';'")
+
+        split = self.name_start(start, end)
+        if split == start:
+            self.error("expected a type")
+        member = MemberField(self.source(split, end), self.type(start, split))
+        if stop != ";":
+            # Arrays and default values
+            self.scan(";")
+        self.expect(";")
+        return member
+
+    def cls(self) -> Class:
+        self.expect("class")
+        start = self.scan(":{")
+        if start == self.pos:
+            self.error("expected a class name")
+        name = self.source(start, self.pos)
+
+        superclasses = []
+        if self.accept(":"):
+            while True:
+                start = self.scan(",{")
+                if start == self.pos:
+                    self.error("expected a superclass")
+                superclasses.append(self.source(start, self.pos))
+                if not self.accept(","):
+                    break
+
+        self.expect("{")
+        fields = []
+        while not self.accept("}"):
+            if self.at_end:
+                self.error("expected '}'")
+            self.skip_attributes()
+            if self.accept(";"):
+                continue
+            fields.append(self.field())
+        self.accept(";")
+        return Class(name, tuple(superclasses), tuple(fields))
+
+    def classes(self) -> Iterator[Class]:
+        """Yields classes as soon as they are parsed"""
+        while not self.at_end:
+            self.skip_attributes()
+            text = self.text
+            if text == "class":
+                yield self.cls()
+            elif text == "#":
+                self.skip_directive()
+            elif text == ";":
+                self.pos += 1
+            elif not self.at_end:
+                # Free functions, there's nowhere in the tree for them...
+                self.field()
+
+
+def parse(code: str, filename: str = "<broma>") -> list[Class]:
+    return list(Parser(code, filename).classes())
+
+
+def parse_file(path: Union[str, Path]) -> list[Class]:
+    with open(path, "r", encoding="utf-8") as r:
+        return parse(r.read(), str(path))
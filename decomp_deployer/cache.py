@@ -0,0 +1,201 @@
+"""A ccache style cache of whole generated trees. The key is a hash of the
+bindings, the generator itself and every option that changes what gets
+written, the value is the tree packed up into a .tar.gz. On a hit nothing is
+parsed or rendered, the archive is unpacked straight into the output...
+
+The cache is either a directory (which can be shared between CI jobs) or an
+http server that answers GET and PUT, `python -m decomp_deployer.standin --writable`
+is enough for one.
+
+    decomp-deploy generate --cache ~/.cache/decomp-deploy
+    decomp-deploy generate --cache http://127.0.0.1:8080/cache
+"""
+
+import hashlib
+import json
+import os
+import tarfile
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Union
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from .compile_db import COMPILE_COMMANDS, PER_PLATFORM_DIR, angle_includes, write_editor_configs
+from .model import BINDINGS_FILES, MODEL_CACHE
+from .output import ArchiveOutput, Output, TeeOutput, atomic_write
+from .profiling import Profiler
+from .resources import ENUMS_FILE
+from .templates import DEFAULT_TEMPLATES, Templates
+from .writer import write_everything
+
+# Files made next to the tree (the indexes and the model) are packed under here
+EXTRAS = ".extras/"
+
+ARCHIVE_SUFFIX = ".tar.gz"
+
+# These have absolute paths and what's unpacked in cocos2d in them, they are made again after every restore
+EDITOR_CONFIGS = (COMPILE_COMMANDS, PER_PLATFORM_DIR + "/", ".vscode/c_cpp_properties.json")
+
+
+class DirectoryCache:
+    """Entries are kept as `<root>/<first two characters of the key>/<key>.tar.gz`"""
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+
+    def __str__(self) -> str:
+        return str(self.root)
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / (key + ARCHIVE_SUFFIX)
+
+    def fetch(self, key: str) -> Optional[bytes]:
+        try:
+            return self.path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, data: bytes):
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Other jobs sharing the cache could be reading this entry right now...
+        atomic_write(path, data)
+
+
+class HttpCache:
+    """Entries are `<url>/<key>.tar.gz`, a 404 is a miss and new ones are PUT"""
+
+    def __init__(self, url: str, timeout: float = 60) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        return self.url
+
+    def fetch(self, key: str) -> Optional[bytes]:
+        try:
+            with urlopen(f"{self.url}/{key}{ARCHIVE_SUFFIX}", timeout=self.timeout) as r:
+                return r.read()
+        except HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def store(self, key: str, data: bytes):
+        request = Request(f"{self.url}/{key}{ARCHIVE_SUFFIX}", data=data, method="PUT")
+        request.add_header("Content-Type", "application/gzip")
+        with urlopen(request, timeout=self.timeout):
+            pass
+
+
+def open_cache(target: Union[str, Path]) -> Union[DirectoryCache, HttpCache]:
+    """http(s) urls are served caches, anything else is a directory"""
+    if str(target).startswith(("http://", "https://")):
+        return HttpCache(str(target))
+    return DirectoryCache(target)
+
+
+@lru_cache(maxsize=None)
+def generator_fingerprint() -> str:
+    """Hash of the generator's own code and data, any change to it (a new
+    version or a local edit) makes every old entry miss"""
+    package = Path(__file__).parent
+    h = hashlib.sha256()
+    for f in sorted([*package.glob("*.py"), *(package / "data").glob("*.h")]):
+        h.update(f.name.encode("utf-8") + b"\0" + f.read_bytes() + b"\0")
+    return h.hexdigest()
+
+
+def cache_key(bindings: Union[str, Path], templates: Templates = None, categories: dict = None, symbols: bool = False, addresses: bool = False, shard: tuple[int, int] = None) -> str:
+    """Hash of everything that changes what `write_everything` writes"""
+    bindings = Path(bindings)
+    h = hashlib.sha256(generator_fingerprint().encode("utf-8"))
+    for name in (*BINDINGS_FILES, ENUMS_FILE):
+        path = bindings / name
+        # Enums.hpp is optional, the bundled enums are used without it
+        data = path.read_bytes() if path.exists() else b""
+        h.update(name.encode("utf-8") + b"\0" + hashlib.sha256(data).digest())
+    options = {
+        "templates": (templates if templates is not None else DEFAULT_TEMPLATES).texts,
+        "categories": {t.name: path for t, path in (categories or {}).items()},
+        "symbols": symbols,
+        "addresses": addresses,
+        "shard": shard,
+    }
+    h.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def restore(data: bytes, output: Output, extras: dict[str, Optional[Path]]) -> list[str]:
+    """Unpacks a cached tree into `output` and the extras to where they belong,
+    returns the names of the files that were restored"""
+    restored = []
+    with tarfile.open(fileobj=BytesIO(data), mode="r:gz") as tar:
+        members = [m for m in tar.getmembers() if m.isfile() and not m.name.startswith(EDITOR_CONFIGS)]
+        for m in members:
+            if m.name.startswith("/") or ".." in m.name.split("/"):
+                raise ValueError(f"Refusing to restore {m.name!r} from the cache")
+        tree = [m for m in members if not m.name.startswith(EXTRAS)]
+        output.plan({m.name.rpartition("/")[0] for m in tree if "/" in m.name})
+        for m in members:
+            content = tar.extractfile(m).read()
+            if m.name.startswith(EXTRAS):
+                if (path := extras.get(m.name[len(EXTRAS):])) is not None:
+                    atomic_write(path, content)
+                continue
+            output.write(m.name, content.decode("utf-8"))
+            restored.append(m.name)
+    return restored
+
+
+def write_everything_cached(cache: Union[DirectoryCache, HttpCache], output: Output, profiler: Profiler = None, bindings: Union[str, Path] = ".temp", symbols: Union[str, Path] = None, templates: Templates = None, work_dir: Union[str, Path] = ".", categories: dict = None, parser: str = None, addresses: Union[str, Path] = None, shard: tuple[int, int] = None, root: Union[str, Path] = ".", editor_configs: bool = True) -> bool:
+    """`write_everything` that first looks in `cache` for the same tree and
+    stores it there afterwards when it wasn't. A cache that can't be reached is
+    treated as a miss. Returns if it was a hit"""
+    if profiler is None:
+        profiler = Profiler()
+    extras = {
+        "symbols.db": Path(symbols) if symbols else None,
+        "addresses.json": Path(addresses) if addresses else None,
+        MODEL_CACHE: Path(work_dir) / MODEL_CACHE,
+    }
+
+    with profiler.phase("cache_lookup"):
+        key = cache_key(bindings, templates, categories, bool(symbols), bool(addresses), shard)
+        try:
+            data = cache.fetch(key)
+        except OSError as e:
+            print(f"[!] Artifact cache {cache} can't be reached ({e}), generating everything")
+            data = None
+
+    if data is not None:
+        with profiler.phase("cache_restore"):
+            restored = restore(data, output, extras)
+        if shard is None and editor_configs:
+            with profiler.phase("vscode"):
+                sources = [name for name in restored if name.startswith("src/")]
+                write_editor_configs(output, root, sources, angle_includes((templates or DEFAULT_TEMPLATES).texts["includes"]))
+        profiler.count("cache_hits")
+        profiler.count("files_written", len(restored))
+        print(f"[+] Restored {len(restored)} files from the artifact cache ({key[:12]})")
+        return True
+
+    profiler.count("cache_misses")
+    archive_path = Path(work_dir) / f".{key}.{os.getpid()}{ARCHIVE_SUFFIX}"
+    try:
+        with ArchiveOutput(archive_path) as archive:
+            write_everything(output=TeeOutput(output, archive), profiler=profiler, bindings=bindings, symbols=symbols, templates=templates, work_dir=work_dir, categories=categories, parser=parser, addresses=addresses, shard=shard, root=root, editor_configs=editor_configs)
+            for name, path in extras.items():
+                if path is not None and path.exists():
+                    archive.write_bytes(EXTRAS + name, path.read_bytes())
+        with profiler.phase("cache_store"):
+            try:
+                cache.store(key, archive_path.read_bytes())
+            except OSError as e:
+                print(f"[!] Couldn't store the tree in the artifact cache {cache} ({e})")
+    finally:
+        if archive_path.exists():
+            os.unlink(archive_path)
+    return False
@@ -0,0 +1,524 @@
+"""The `decomp-deploy` command. Every stage of the install is it's own subcommand
+and they all share one work directory (`--work-dir`, `.temp` by default) holding
+the downloads, their ETags and the model cache, so CI can cache that directory
+and only rerun the stages it actually needs...
+
+    decomp-deploy fetch -v 2.2074
+    decomp-deploy generate
+    decomp-deploy clean
+
+Running it without a subcommand fetches, generates and cleans up after itself
+the same way `python main.py` always has"""
+
+# NOTE: Only what every command needs is imported up here, aiohttp, the writer and
+# friends are imported by the commands that use them so `--help` and small
+# commands like `symbols` don't have to wait on them...
+import asyncclick as click
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from .model import BINDINGS_FILES, CONCAT_CACHE, MODEL_CACHE, PARSERS
+from .profiling import PROFILERS, Profiler
+from .proxies import STRATEGIES
+
+if TYPE_CHECKING:
+    from .formatting import Formatter
+    from .output import Output
+    from .proxies import ProxyPool
+    from .templates import Templates
+
+
+COCOS2D_REPO = "https://github.com/CallocGD/cocos-headers/archive/refs/heads/master.zip"
+
+WORK_DIR = ".temp"
+
+# Threads writing the generated files while the next ones are rendered
+WRITERS = 4
+
+
+class LazyGroup(click.Group):
+    """A group of commands that only imports the module they're in (`target`,
+    e.g. `.bench:cli`) once one of them is actually used, `--help` only needs
+    the help given here"""
+
+    def __init__(self, name:str, target:str, **attrs) -> None:
+        super().__init__(name, **attrs)
+        self.target = target
+
+    def group(self) -> click.Group:
+        from importlib import import_module
+
+        module, _, attribute = self.target.partition(":")
+        return getattr(import_module(module, __package__), attribute)
+
+    def list_commands(self, ctx:click.Context):
+        return self.group().list_commands(ctx)
+
+    def get_command(self, ctx:click.Context, cmd_name:str):
+        return self.group().get_command(ctx, cmd_name)
+
+
+def load_categories(categories:tuple[str, ...] = ()):
+    """Turns `Layer=UI/Layers` pairs into the writer's category mapping, the
+    path has to stay inside of headers/ and src/"""
+    from pathlib import PureWindowsPath
+    from .writer import ClassType
+
+    mapping = {}
+    for c in categories:
+        kind, _, path = c.partition("=")
+        if kind not in ClassType.__members__ or kind in ("Cocos2d", "Delegate") or not path.strip("/"):
+            raise click.BadParameter(f"{c!r} should look like Layer=UI/Layers", param_hint="--category")
+        path = path.replace("\\", "/")
+        if path.startswith("/") or PureWindowsPath(path).drive or any(part in ("", ".", "..") for part in path.rstrip("/").split("/")):
+            raise click.BadParameter(f"{c!r} has to be a relative path without . or .. in it, e.g. Layer=UI/Layers", param_hint="--category")
+        mapping[ClassType[kind]] = path.rstrip("/")
+    return mapping
+
+
+def load_shard(ctx:click.Context, param:click.Parameter, value:Optional[str]):
+    if value is None:
+        return None
+    from .shards import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def output_target(archive:Optional[str], git:Optional[str]) -> Optional[str]:
+    """`--git` is another way of giving an archive, as a `git:` target for open_output"""
+    if archive and git:
+        raise click.UsageError("--archive and --git can't be used together")
+    return f"git:{git}" if git else archive
+
+
+def load_formatter(enabled:bool, binary:Optional[str], output:Path, work_dir:Path, jobs:Optional[int] = None) -> Optional["Formatter"]:
+    """The formatter for `--format`, a missing clang-format only gets a warning since formatting is a nicety"""
+    if not enabled:
+        return None
+    from .formatting import FORMAT_CACHE, Formatter, find_clang_format
+
+    if (found := find_clang_format(binary)) is None:
+        print(f"[!] {binary or 'clang-format'} wasn't found, the generated files are left unformatted")
+        return None
+    return Formatter(found, output, work_dir / FORMAT_CACHE, jobs)
+
+
+def formatted(output:"Output", formatter:Optional["Formatter"]) -> "Output":
+    if formatter is None:
+        return output
+    from .formatting import FormattingOutput
+
+    return FormattingOutput(output, formatter)
+
+
+def load_templates(directory:str = None):
+    if not directory:
+        return None
+    from .templates import TemplateError, Templates
+
+    try:
+        return Templates.from_directory(directory)
+    except TemplateError as e:
+        raise click.BadParameter(f"{Path(directory) / (e.name + '.tmpl')}: {e}", param_hint="--templates")
+    except (OSError, UnicodeDecodeError) as e:
+        raise click.BadParameter(str(e), param_hint="--templates")
+
+
+def make_pool(proxies:tuple[str, ...], strategy:str = "least-loaded") -> "ProxyPool":
+    from .proxies import ProxyPool
+
+    return ProxyPool(proxies, strategy)
+
+
+def report_proxies(pool:"ProxyPool", profiler:Profiler):
+    """Shows how every proxy did, a single proxy (or none) has nothing to compare against"""
+    if len(pool) < 2:
+        return
+    for proxy, line in zip(pool.proxies, pool.report()):
+        print(f"[+] {line}")
+        profiler.count(f"proxy_bytes.{proxy.name}", proxy.bytes)
+
+
+async def downloadBindings(proxy:Union[str, "ProxyPool"] = "", version:str = "2.205", profiler:Profiler = None, work_dir:Path = Path(WORK_DIR), enums:bool = True):
+    """Without `enums` includes.h gets the bundled enums, geode only has the
+    Enums.hpp of the newest version so older versions are better off without it"""
+    from aiohttp import ClientError
+    from .client import Client
+    from .resources import ENUMS_FILE
+
+    async with Client(proxy, work_dir=work_dir) as client:
+        print("[...] Installing Bindings...")
+        with profiler.phase("download.bindings"):
+            await client.downloadBindings(version)
+            if not enums:
+                # One from an earlier fetch would still be picked up by the writer
+                (work_dir / ENUMS_FILE).unlink(missing_ok=True)
+            else:
+                try:
+                    await client.downloadEnums()
+                except ClientError as e:
+                    # Not the end of the world, includes.h just gets the enums we ship with
+                    print(f"[!] Couldn't download Enums.hpp ({e}), using the bundled enums instead")
+        profiler.count("bytes_downloaded", client.bytes_downloaded)
+        print("[+] Bindings Installed")
+
+
+async def downloadCocos2d(proxy:Union[str, "ProxyPool"] = "", profiler:Profiler = None, work_dir:Path = Path(WORK_DIR), output:Path = Path(".")):
+    import shutil
+    import zipfile
+    from .client import Client
+    from .manifest import record
+
+    print("[...] Downloading Cocos2d and Other Geometry Dash External Libraries...")
+    async with Client(proxy, work_dir=work_dir) as client:
+        with profiler.phase("download.cocos2d"):
+            # The zip stays in the work directory so that next time we only have to ask if it changed
+            changed = await client.downloadFile(COCOS2D_REPO, "cocos2d.zip")
+        profiler.count("bytes_downloaded", client.bytes_downloaded)
+    if changed or not (output / "cocos2d").exists():
+        with profiler.phase("unpack.cocos2d"):
+            shutil.unpack_archive(work_dir / "cocos2d.zip", output / "cocos2d")
+            with zipfile.ZipFile(work_dir / "cocos2d.zip") as z:
+                record(output, ["cocos2d/" + name for name in z.namelist() if not name.endswith("/")])
+    print("[+] Cocos2d Download Complete")
+
+
+def buildEnvironment(work_dir:Path, output:Path, archive:str = None, profiler:Profiler = None, symbols:str = None, templates:"Templates" = None, writers:int = WRITERS, categories:dict = None, parser:str = None, addresses:str = None, shard:tuple[int, int] = None, cache:str = None, formatter:"Formatter" = None, editor_configs:bool = True):
+    from .addresses import ADDRESSES_FILE
+    from .manifest import record_paths
+    from .output import open_output
+    from .writer import write_everything
+
+    if missing := [name for name in BINDINGS_FILES if not (work_dir / name).exists()]:
+        raise click.ClickException(f"{', '.join(missing)} missing from {work_dir}, run `decomp-deploy fetch` first")
+
+    print("[...] Building Decomp Enviornment")
+    # Everything is staged first so a failed (or concurrent) run never leaves a half written tree behind
+    if shard is None:
+        symbols = symbols or output / "symbols.db"
+        addresses = addresses or output / ADDRESSES_FILE
+    # The compile databases have absolute paths of this machine, they're of no use in an archive or a git branch
+    options = dict(profiler=profiler, bindings=work_dir, symbols=symbols, templates=templates, work_dir=work_dir, categories=categories, parser=parser, addresses=addresses, shard=shard, root=output, editor_configs=editor_configs and archive is None)
+    with formatted(open_output(archive or output, staged=True, writers=writers), formatter) as out:
+        if cache:
+            from .cache import open_cache, write_everything_cached
+
+            write_everything_cached(open_cache(cache), out, **options)
+        else:
+            write_everything(output=out, **options)
+    # The tree recorded itself, the indexes next to it have to be added by hand
+    record_paths(output, [p for p in (symbols, addresses) if p and Path(p).exists()])
+    print("[+] Decomp enviornment finished")
+
+
+def writeEditorConfigs(output:Path, profiler:Profiler, templates:"Templates" = None):
+    """Writes the compile databases and the vscode config for the tree in
+    `output` on their own, for when cocos2d was still being unpacked while the
+    tree was generated. The sources are the ones in the manifest"""
+    from .compile_db import angle_includes, write_editor_configs
+    from .manifest import Manifest
+    from .output import DirectoryOutput
+    from .templates import DEFAULT_TEMPLATES
+
+    sources = sorted(name for name in Manifest.load(output).files if name.startswith("src/"))
+    with profiler.phase("vscode"), DirectoryOutput(output) as out:
+        write_editor_configs(out, output, sources, angle_includes((templates or DEFAULT_TEMPLATES).texts["includes"]))
+
+
+def clean_work_dir(work_dir:Path, names:Optional[Iterable[str]] = None) -> list[Path]:
+    """Removes `names` from the work directory or everything in it when no names
+    are given, the directory itself goes away once it's empty. Returns what was removed"""
+    import shutil
+
+    if not work_dir.is_dir():
+        return []
+    removed = []
+    for path in [work_dir / name for name in names] if names is not None else list(work_dir.iterdir()):
+        if path.is_file():
+            path.unlink()
+            removed.append(path)
+        elif path.is_dir():
+            # The clang-format cache
+            shutil.rmtree(path)
+            removed.append(path)
+    if not any(work_dir.iterdir()):
+        work_dir.rmdir()
+    return removed
+
+
+@click.group(invoke_without_command=True)
+@click.option("--output", "-o", default=".", envvar="DECOMP_DEPLOY_OUTPUT", help="Root of the decomp environment, everything is written somewhere inside of it")
+@click.option("--work-dir", "-w", default=None, envvar="DECOMP_DEPLOY_WORK_DIR", help="Where downloads and caches shared between the stages are kept, <output>/.temp by default")
+@click.option("--report", default=None, help="Writes a json report of how long every phase took along with bytes and files written, <output>/decomp-report.json with only --profile")
+@click.option("--profile", type=click.Choice(PROFILERS), default=None, help="Runs a profiler over the whole command and dumps it next to the report")
+@click.option("--parser", type=click.Choice(PARSERS), default=None, envvar="DECOMP_DEPLOY_PARSER", help="Parses the bindings with pybroma or the built-in python parser, pybroma if it's installed by default")
+@click.option("--version", "-v", default="2.2074", help="Bindings version, only used without a subcommand")
+@click.option("--enums/--no-enums", default=True, help="Downloads geode's Enums.hpp for includes.h, it's always the one of the newest bindings so older versions should use the bundled enums with --no-enums, only used without a subcommand")
+@click.option("--proxy", "-p", multiple=True, help="Downloads everything through a proxy, given more than once the downloads are spread over all of them, only used without a subcommand")
+@click.option("--proxy-strategy", type=click.Choice(STRATEGIES), default="least-loaded", help="How a proxy is picked for every download, the one with the fewest downloads or randomly weighted by latency")
+@click.option("--archive", "-a", default=None, help="Writes the generated headers and sources into a .zip or .tar(.gz) archive instead of the current directory, only used without a subcommand")
+@click.option("--symbols", default=None, help="Where the sqlite index of classes, functions, members and addresses is made (<output>/symbols.db by default), only used without a subcommand")
+@click.option("--addresses", default=None, help="Where the sorted address tables used by `lookup` are saved (<output>/addresses.json by default), only used without a subcommand")
+@click.option("--templates", "-t", default=None, help="Directory of <name>.tmpl files that replace the default C++ templates, only used without a subcommand")
+@click.option("--writers", default=WRITERS, help="Threads writing the generated files (0 writes them from the generator itself), only used without a subcommand")
+@click.option("--cache", default=None, envvar="DECOMP_DEPLOY_CACHE", help="Directory or http url of an artifact cache of whole trees, only used without a subcommand")
+@click.pass_context
+async def cli(ctx:click.Context, output:str, work_dir:str, report:str, profile:str, parser:str, proxy:tuple[str, ...], proxy_strategy:str, version:str, enums:bool, archive:str, symbols:str, addresses:str, templates:str, writers:int, cache:str):
+    """Installs cocos2d and the bindings and then builds the whole decomp environment"""
+    output = Path(output)
+    work_dir = Path(work_dir) if work_dir else output / WORK_DIR
+    profiler = Profiler(profile)
+    ctx.obj = {"output": output, "work_dir": work_dir, "profiler": profiler, "parser": parser}
+
+    if report or profile:
+        # Inside of the output so that runs into different outputs don't overwrite each other's reports
+        report = Path(report) if report else output / "decomp-report.json"
+
+        def dump():
+            profiler.dump(report)
+            print(f"[+] Report written to {report}")
+
+        ctx.call_on_close(dump)
+
+    if ctx.invoked_subcommand is not None:
+        return
+
+    import asyncio
+    import functools
+
+    # Both downloads share the pool so they balance over the same proxies
+    pool = make_pool(proxy, proxy_strategy)
+
+    loaded = load_templates(templates)
+
+    async def bindings():
+        await downloadBindings(pool, version, profiler, work_dir, enums)
+        # The editor configs are found through cocos2d so they wait until it's unpacked
+        build = functools.partial(buildEnvironment, work_dir, output, archive=archive, profiler=profiler, symbols=symbols, templates=loaded, writers=writers, parser=parser, addresses=addresses, cache=cache, editor_configs=False)
+        if profiler.profiler is not None:
+            # The profilers only see the thread they were started on, cocos2d has to wait for the tree meanwhile
+            build()
+        else:
+            # Generating is all blocking work, keep it off the event loop so cocos2d keeps downloading meanwhile
+            await asyncio.to_thread(build)
+
+    task1 = asyncio.create_task(downloadCocos2d(pool, profiler, work_dir, output))
+    task2 = asyncio.create_task(bindings())
+    for t in asyncio.as_completed([task1, task2]):
+        await t
+    if archive is None:
+        writeEditorConfigs(output, profiler, loaded)
+    report_proxies(pool, profiler)
+    print("[+] Installation Completed")
+    # NOTE: the model is kept around so that `generate -c` can rebuild single classes without parsing again
+    clean_work_dir(work_dir, BINDINGS_FILES + (CONCAT_CACHE,))
+
+
+@cli.command()
+@click.option("--version", "-v", default="2.2074")
+@click.option("--proxy", "-p", multiple=True, help="Downloads everything through a proxy, given more than once the downloads are spread over all of them")
+@click.option("--proxy-strategy", type=click.Choice(STRATEGIES), default="least-loaded", help="How a proxy is picked for every download, the one with the fewest downloads or randomly weighted by latency")
+@click.option("--cocos2d/--no-cocos2d", default=True, help="Also downloads and unpacks cocos2d and the other external libraries")
+@click.option("--enums/--no-enums", default=True, help="Downloads geode's Enums.hpp for includes.h, it's always the one of the newest bindings so older versions should use the bundled enums with --no-enums")
+@click.pass_obj
+async def fetch(obj:dict, version:str, proxy:tuple[str, ...], proxy_strategy:str, cocos2d:bool, enums:bool):
+    """Downloads the bindings (and cocos2d) into the work directory, files that
+    didn't change since the last fetch aren't downloaded again"""
+    import asyncio
+
+    pool = make_pool(proxy, proxy_strategy)
+    tasks = [downloadBindings(pool, version, obj["profiler"], obj["work_dir"], enums)]
+    if cocos2d:
+        tasks.append(downloadCocos2d(pool, obj["profiler"], obj["work_dir"], obj["output"]))
+    await asyncio.gather(*tasks)
+    report_proxies(pool, obj["profiler"])
+
+
+@cli.command()
+@click.option("--class", "-c", "classes", multiple=True, help="Only regenerates these classes from the last full generate, can be given more than once")
+@click.option("--superclasses", "-s", is_flag=True, help="Also generates every class the given classes inherit from")
+@click.option("--archive", "-a", default=None, help="Writes the generated files into a .zip or .tar(.gz) archive instead of the output directory")
+@click.option("--git", default=None, metavar="REPO[#BRANCH]", help="Commits the generated files to a branch (decomp by default) of a git repository with fast-import instead of writing them out")
+@click.option("--symbols", default=None, help="Where the sqlite index of classes, functions, members and addresses is made, <output>/symbols.db by default")
+@click.option("--addresses", default=None, help="Where the sorted address tables used by `lookup` are saved, <output>/addresses.json by default")
+@click.option("--templates", "-t", default=None, help="Directory of <name>.tmpl files that replace the default C++ templates")
+@click.option("--writers", default=WRITERS, help="Threads writing the generated files (0 writes them from the generator itself)")
+@click.option("--category", "categories", multiple=True, help="Puts a kind of class somewhere else under headers/ and src/, e.g. Layer=UI/Layers (Manager, Cell, ToolBox, CustomCC, Layer or Default)")
+@click.option("--cache", default=None, envvar="DECOMP_DEPLOY_CACHE", help="Directory or http url of an artifact cache, a tree made from the same bindings and options is unpacked instead of generated")
+@click.option("--shard", default=None, callback=load_shard, help="Only generates shard i of N (e.g. 2/4) along with a manifest for `merge`, classes are split up by a stable hash of their name")
+@click.option("--format", "format_", is_flag=True, help="Runs clang-format over the files that changed, using the .clang-format in the output if there is one")
+@click.option("--clang-format", "clang_format", default=None, help="The clang-format binary used by --format, the one on PATH by default")
+@click.option("--format-jobs", default=None, type=int, help="clang-format processes running at once, one per cpu by default")
+@click.pass_obj
+def generate(obj:dict, classes:tuple[str, ...], superclasses:bool, archive:str, git:str, symbols:str, addresses:str, templates:str, writers:int, categories:tuple[str, ...], cache:str, shard:Optional[tuple[int, int]], format_:bool, clang_format:str, format_jobs:int):
+    """Builds the decomp environment from the fetched bindings, with `--class`
+    only the given classes are regenerated from the model of the last build"""
+    if shard is not None and (classes or symbols or addresses):
+        raise click.UsageError("--shard can't be used with --class, --symbols or --addresses, those need every class")
+    archive = output_target(archive, git)
+    formatter = load_formatter(format_, clang_format, obj["output"], obj["work_dir"], format_jobs)
+    if not classes:
+        buildEnvironment(obj["work_dir"], obj["output"], archive=archive, profiler=obj["profiler"], symbols=symbols, templates=load_templates(templates), writers=writers, categories=load_categories(categories), parser=obj["parser"], addresses=addresses, shard=shard, cache=cache, formatter=formatter)
+        return
+
+    from .output import open_output
+    from .writer import write_classes
+
+    try:
+        with formatted(open_output(archive or obj["output"], writers=writers), formatter) as output:
+            written = write_classes(list(classes), output, superclasses, obj["work_dir"] / MODEL_CACHE, templates=load_templates(templates), categories=load_categories(categories))
+    except (FileNotFoundError, ValueError) as e:
+        # No model yet or one from an older version of the generator
+        raise click.ClickException(str(e))
+    for name in written:
+        print(f"[+] {name}")
+    for name in sorted(set(classes) - set(written)):
+        print(f"[!] {name} was not generated (unknown class, delegate or a cocos2d class)")
+
+
+@cli.command()
+@click.argument("shards", nargs=-1, required=True, type=click.Path(exists=True, file_okay=False))
+@click.option("--archive", "-a", default=None, help="Writes the merged tree into a .zip or .tar(.gz) archive instead of the output directory")
+@click.option("--git", default=None, metavar="REPO[#BRANCH]", help="Commits the merged tree to a branch (decomp by default) of a git repository instead of writing it out")
+@click.option("--templates", "-t", default=None, help="Directory of <name>.tmpl files that replace the default C++ templates, only includes.h is rendered here")
+@click.option("--writers", default=WRITERS, help="Threads writing the merged files (0 writes them from the merge itself)")
+@click.pass_obj
+def merge(obj:dict, shards:tuple[str, ...], archive:str, git:str, templates:str, writers:int):
+    """Puts the outputs of every `generate --shard` together into the output,
+    includes.h is made out of their manifests"""
+    from .output import open_output
+    from .writer import merge_shards
+
+    archive = output_target(archive, git)
+    print(f"[...] Merging {len(shards)} shards")
+    try:
+        with open_output(archive or obj["output"], staged=True, writers=writers) as output:
+            merged = merge_shards([Path(s) for s in shards], output=output, templates=load_templates(templates), profiler=obj["profiler"], root=obj["output"], editor_configs=archive is None)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    print(f"[+] Merged {merged} classes")
+
+
+@cli.command()
+@click.option("--keep-model", is_flag=True, help="Keeps the model cache so that `generate --class` still works")
+@click.option("--uninstall", is_flag=True, help="Also removes every file and directory the generator made in the output, files of your own are left alone")
+@click.option("--workers", default=16, help="Threads removing files with --uninstall")
+@click.pass_obj
+def clean(obj:dict, keep_model:bool, uninstall:bool, workers:int):
+    """Removes everything in the work directory, with --uninstall everything
+    listed in the output's manifest goes as well"""
+    work_dir = obj["work_dir"]
+    names = None
+    if keep_model and work_dir.is_dir():
+        names = [p.name for p in work_dir.iterdir() if p.name != MODEL_CACHE]
+    removed = clean_work_dir(work_dir, names)
+    print(f"[+] Removed {len(removed)} files from {work_dir}")
+    if not uninstall:
+        return
+
+    from .manifest import MANIFEST_FILE, Manifest, locked
+
+    output = obj["output"]
+    if not (output / MANIFEST_FILE).exists():
+        print(f"[!] Nothing to uninstall, there's no {MANIFEST_FILE} in {output}")
+        return
+    with locked(output):
+        try:
+            manifest = Manifest.load(output)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        files, directories = manifest.remove(workers)
+    print(f"[+] Removed {files} files and {directories} directories from {output}")
+    if manifest.files or manifest.directories:
+        print(f"[!] {len(manifest.files)} files and {len(manifest.directories)} directories were left behind (files of your own or no permission), they are still in {MANIFEST_FILE}")
+
+
+@cli.command()
+@click.option("--bindings", "-b", default=None, help="Directory holding the Cocos2d, GeometryDash and Extras broma files, the work directory by default")
+@click.option("--interval", default=0.1, help="Seconds between checks when polling for changes")
+@click.pass_obj
+async def watch(obj:dict, bindings:str, interval:float):
+    """Regenerates the classes that change whenever the broma files are edited"""
+    from .output import DirectoryOutput
+    from .watch import Watcher
+
+    bindings = Path(bindings) if bindings else obj["work_dir"]
+    if missing := [name for name in BINDINGS_FILES if not (bindings / name).exists()]:
+        # The install cleans them out of the work directory once it's done
+        raise click.ClickException(f"{', '.join(missing)} missing from {bindings}, run `decomp-deploy fetch` first or point --bindings at your broma files")
+    await Watcher(bindings, DirectoryOutput(obj["output"]), obj["work_dir"] / CONCAT_CACHE, obj["parser"]).run(interval)
+
+
+@cli.command()
+@click.option("--db", default=None, help="The index made by the last install, <output>/symbols.db by default")
+@click.option("--class", "-c", "cls", default=None, help="Shows the superclasses, members and functions of a class")
+@click.option("--takes", default=None, help="Functions that take an argument of this type, e.g. GJGameLevel*")
+@click.option("--returns", default=None, help="Functions that return this type")
+@click.option("--member-type", default=None, help="Members of this type")
+@click.option("--subclasses", default=None, help="Classes that directly inherit from this class")
+@click.option("--address", default=None, help="Function bound at this address, e.g. 0x2ea000")
+@click.option("--platform", default=None, help="Limits --address to a single platform (win, imac, m1, ios...)")
+@click.pass_obj
+def symbols(obj:dict, db:str, cls:str, takes:str, returns:str, member_type:str, subclasses:str, address:str, platform:str):
+    """Looks things up in the symbol index"""
+    from .symbols import SymbolQuery
+
+    try:
+        query = SymbolQuery(db or obj["output"] / "symbols.db")
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e))
+    with query:
+        results = []
+        if cls:
+            results += query.class_info(cls)
+        if takes:
+            results += query.functions_taking(takes)
+        if returns:
+            results += query.functions_returning(returns)
+        if member_type:
+            results += query.members_of_type(member_type)
+        if subclasses:
+            results += query.subclasses(subclasses)
+        if address:
+            results += query.address(int(address, 0), platform)
+    for line in results:
+        print(line)
+
+
+@cli.command()
+@click.argument("address")
+@click.option("--platform", "-p", default=None, help="Only looks on this platform (win, imac, m1, ios...), every platform by default")
+@click.option("--table", default=None, help="The address tables made by the last install, <output>/addresses.json by default")
+@click.option("--exact", is_flag=True, help="Only shows functions bound at exactly this address")
+@click.pass_obj
+def lookup(obj:dict, address:str, platform:str, table:str, exact:bool):
+    """Finds the function an address belongs to, e.g. `lookup 0x1234ab --platform win`"""
+    from .addresses import ADDRESSES_FILE, load_tables
+
+    try:
+        address = int(address, 0)
+    except ValueError:
+        raise click.BadParameter(f"{address!r} is not an address, e.g. 0x1234ab", param_hint="ADDRESS")
+    try:
+        tables = load_tables(table or obj["output"] / ADDRESSES_FILE)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e))
+    if platform:
+        if platform not in tables:
+            raise click.ClickException(f"No addresses for {platform}, there are addresses for {', '.join(tables)}")
+        tables = {platform: tables[platform]}
+
+    for name, t in tables.items():
+        if exact:
+            for symbol in t.exact(address):
+                print(f"{name} {hex(address)} {symbol}")
+        elif (found := t.lookup(address)) is not None:
+            start, symbol = found
+            print(f"{name} {hex(address)} {symbol}" + (f"+{hex(address - start)}" if address != start else ""))
+
+
+# The benchmarks import the writer, the stand-in server and friends
+cli.add_command(LazyGroup("bench", ".bench:cli", help="Offline benchmarks of the generator, the downloader and startup"))
@@ -1,6 +1,6 @@
 # -- Third party resources --
-from aiohttp import ClientSession
-from aiohttp_socks import ProxyConnector
+from aiohttp import ClientConnectionError, ClientPayloadError, ClientSession
+from aiohttp_socks import ProxyConnectionError, ProxyConnector, ProxyError, ProxyTimeoutError
 from aiofiles import open as aopen
 
 # Included with aiohttp
@@ -8,69 +8,147 @@ from yarl import URL
 
 #  User-Agent bag
 from .user_agents import random_useragent
+from .output import partial_path
+from .proxies import ProxyPool
 
-from typing import Union
+from typing import Iterable, Union
 from pathlib import Path
 import os
+import shutil
+import time
 import asyncio
 
 
 BINDINGS_URL = URL("https://raw.githubusercontent.com/geode-sdk/bindings/main/bindings")
 
+# Reading 1kb at a time costs us a syscall and an await per kilobyte...
+CHUNK_SIZE = 64 * 1024
 
-def format_url(filename: str, ver: str):
-    return BINDINGS_URL / ver / filename
+# Failures that are the proxy's fault (or the way to it), anything else such as a 404 is the server's
+PROXY_ERRORS = (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError, ProxyError, ProxyConnectionError, ProxyTimeoutError)
 
 
-def make_bindings_filenames(version: str):
+def format_url(filename: str, ver: str, base: URL = BINDINGS_URL):
+    return base / ver / filename
+
+
+def make_bindings_filenames(version: str, base: URL = BINDINGS_URL):
     return {
-        "GeometryDash.bro": format_url("GeometryDash.bro", version),
-        "Extras.bro": format_url("Extras.bro", version),
-        "Cocos2d.bro": format_url("Cocos2d.bro", version),
+        "GeometryDash.bro": format_url("GeometryDash.bro", version, base),
+        "Extras.bro": format_url("Extras.bro", version, base),
+        "Cocos2d.bro": format_url("Cocos2d.bro", version, base),
     }
 
 
+def make_enums_url(base: URL = BINDINGS_URL):
+    """geode keeps a single Enums.hpp next to the bindings instead of one for
+    every version, so it always matches the newest version on `base`'s branch"""
+    return base / "include" / "Geode" / "Enums.hpp"
+
+
 class Client:
     """Used for downloading files and github repos clean and quickly..."""
 
-    def __init__(self, proxy: str = "") -> None:
+    def __init__(self, proxy: Union[str, Iterable[str], ProxyPool] = "", concurrency: int = 2, bindings_url: Union[str, URL] = BINDINGS_URL, work_dir: Union[str, Path] = ".temp") -> None:
         # Make a temporary directory for the data unless otherwise...
-        if not os.path.exists(".temp"):
-            os.mkdir(".temp")
-
-        self.client = ClientSession(
-            connector=ProxyConnector.from_url(proxy) if proxy else None,
-            headers={"User-Agent": random_useragent()},
-            raise_for_status=True,
-        )
-        # Prevent ourselves from being rate-limited...
-        self.limit = asyncio.Semaphore(2)
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+
+        # A pool can be shared between clients so that all of them balance over the same proxies
+        self.pool = proxy if isinstance(proxy, ProxyPool) else ProxyPool(proxy)
+        headers = {"User-Agent": random_useragent()}
+        # One session per proxy since the connector is what talks to the proxy
+        self.sessions = {
+            p.url: ClientSession(
+                connector=ProxyConnector.from_url(p.url) if p.url else None,
+                headers=headers,
+                raise_for_status=True,
+            )
+            for p in self.pool.proxies
+        }
+        self.client = next(iter(self.sessions.values()))
+        # Prevent ourselves from being rate-limited, the limit is per proxy since every proxy is it's own address...
+        self.limit = asyncio.Semaphore(concurrency * len(self.pool))
+        self.bindings_url = URL(bindings_url)
+        self.bytes_downloaded = 0
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, *args):
-        await self.client.close()
-
-    async def downloadFile(self, FileUrl: str, name: Union[str, Path], temp:bool = True):
-        async with aopen((Path(".temp") / name) if temp else name , "wb") as fp, self.limit:
-            async with self.client.get(FileUrl) as resp:
-                while r := await resp.content.read(1024):
-                    await fp.write(r)
+        for session in self.sessions.values():
+            await session.close()
+
+    async def downloadFile(self, FileUrl: str, name: Union[str, Path], temp:bool = True) -> bool:
+        """Downloads into the work directory (unless `temp` is off), returns False
+        if the copy we already had was still up to date"""
+        path = (self.work_dir / name) if temp else Path(name)
+        # If we still have the file from last time, ask the server if it changed at all...
+        etag = self.work_dir / (Path(name).name + ".etag")
+        headers = {}
+        if path.exists() and etag.exists():
+            headers["If-None-Match"] = etag.read_text()
+
+        async with self.limit:
+            tried = []
+            while True:
+                proxy = self.pool.pick(tried)
+                self.pool.started(proxy)
+                start = time.perf_counter()
+                downloaded = 0
+                try:
+                    async with self.sessions[proxy.url].get(FileUrl, headers=headers) as resp:
+                        self.pool.responded(proxy, time.perf_counter() - start)
+                        if resp.status == 304:
+                            self.pool.finished(proxy, 0, time.perf_counter() - start)
+                            return False
+                        # The old etag doesn't describe what's coming, if this download dies the next one starts over
+                        etag.unlink(missing_ok=True)
+                        # Written next to the file and renamed over it once it's all there, the old copy stays whole until then
+                        partial = partial_path(path)
+                        try:
+                            async with aopen(partial, "wb") as fp:
+                                while r := await resp.content.read(CHUNK_SIZE):
+                                    downloaded += len(r)
+                                    self.bytes_downloaded += len(r)
+                                    await fp.write(r)
+                            os.replace(partial, path)
+                        finally:
+                            partial.unlink(missing_ok=True)
+                        if tag := resp.headers.get("ETag"):
+                            etag.write_text(tag)
+                except PROXY_ERRORS as e:
+                    self.pool.failed(proxy)
+                    tried.append(proxy)
+                    if len(tried) >= len(self.pool):
+                        raise
+                    print(f"[!] Downloading {name} through {proxy.name} failed ({e!r}), trying another proxy")
+                    continue
+                except BaseException:
+                    # The proxy did it's job, the server just didn't like the request
+                    self.pool.finished(proxy, downloaded, time.perf_counter() - start)
+                    raise
+                self.pool.finished(proxy, downloaded, time.perf_counter() - start)
+                return True
 
     async def downloadBindings(self, version: str):
         """Downloads and installs all the different broma stuff required for launching and compiling the broma files..."""
         for task in asyncio.as_completed(
             [
                 asyncio.create_task(self.downloadFile(url, name))
-                for name, url in make_bindings_filenames(version).items()
+                for name, url in make_bindings_filenames(version, self.bindings_url).items()
             ]
         ):
             await task
 
+    async def downloadEnums(self):
+        """Downloads geode's Enums.hpp so that includes.h can have up to date enums,
+        these are the enums of the newest bindings whatever version was downloaded..."""
+        await self.downloadFile(make_enums_url(self.bindings_url), "Enums.hpp")
+
 
-def destory_temp_dir():
+def destory_temp_dir(work_dir: Union[str, Path] = ".temp"):
     """Used as part of the cleanup operation..."""
-    if os.path.exists(".temp"):
-        os.remove(".temp")
+    # It's a whole directory of bindings, os.remove can only ever remove a single file
+    shutil.rmtree(work_dir, ignore_errors=True)
 
@@ -0,0 +1,166 @@
+"""compile_commands.json for clangd and the vscode config for IntelliSense, for
+every platform. Both only get the include directories the tree actually needs
+(`headers/` and the directories of cocos2d that includes.h and everything it
+includes are found through) so the indexers stop crawling the whole checkout
+with `${workspaceFolder}/**`...
+
+The database at the root is for the platform we're running on, the others are
+kept under `.compile_commands/<platform>/` for `clangd --compile-commands-dir`."""
+
+import json
+import posixpath
+import re
+import sys
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from .output import Output
+
+COCOS2D_DIR = "cocos2d"
+
+COMPILE_COMMANDS = "compile_commands.json"
+
+PER_PLATFORM_DIR = ".compile_commands"
+
+
+class Target(NamedTuple):
+    """Everything that changes between the platforms of a compile command"""
+
+    name: str
+    """Name of the vscode configuration"""
+    triple: str
+    defines: tuple[str, ...]
+    platform_dir: str
+    """cocos2d's `platform/<platform_dir>`"""
+    intellisense: str
+
+
+TARGETS = {
+    "win": Target("Win32", "x86_64-pc-windows-msvc", ("_DEBUG", "UNICODE", "_UNICODE"), "win32", "windows-msvc-x64"),
+    "mac": Target("Mac", "x86_64-apple-macos10.13", ("CC_TARGET_OS_MAC",), "mac", "macos-clang-x64"),
+    "ios": Target("iOS", "arm64-apple-ios", ("CC_TARGET_OS_IPHONE",), "ios", "ios-clang-arm64"),
+    "android": Target("Android", "aarch64-none-linux-android", ("ANDROID",), "android", "linux-clang-arm64"),
+}
+
+# Where includes.h's headers are in the cocos-headers archive, for when cocos2d isn't unpacked yet to look through
+FALLBACK_INCLUDE_DIRS = (
+    "cocos2d/cocos-headers-master",
+    "cocos2d/cocos-headers-master/cocos2d",
+    "cocos2d/cocos-headers-master/fmt/include",
+)
+
+INCLUDE_RE = re.compile(r'^[ \t]*#[ \t]*include[ \t]*([<"])([^>"\n]+)[>"]', re.M)
+
+HEADER_SUFFIXES = (".h", ".hpp", ".hh", ".hxx", ".inl")
+
+
+def host_platform() -> str:
+    """The platform of the root compile_commands.json, windows is what most of the decomp happens on"""
+    if sys.platform == "darwin":
+        return "mac"
+    return "win"
+
+
+def angle_includes(code: str) -> list[str]:
+    """Every `#include <...>` in `code`, in order"""
+    return [name for kind, name in INCLUDE_RE.findall(code) if kind == "<"]
+
+
+def cocos2d_headers(root: Union[str, Path]) -> Optional[set[str]]:
+    """Every header under cocos2d relative to `root`, None when cocos2d isn't
+    there to look through. Made once and shared by every target"""
+    cocos = Path(root) / COCOS2D_DIR
+    if not cocos.is_dir():
+        return None
+    return {p.relative_to(root).as_posix() for p in cocos.rglob("*") if p.suffix in HEADER_SUFFIXES and p.is_file()}
+
+
+def find_include_dirs(root: Union[str, Path], files: set[str], headers: list[str], target: Target) -> list[str]:
+    """Directories (relative to `root`) under cocos2d that `headers` and every
+    cocos2d header they include are found through, `files` is what
+    `cocos2d_headers` found. A header that's in several places is taken from
+    the target's platform directory when it's one of them, includes that
+    aren't anywhere in cocos2d (the standard library, windows.h) are left to
+    the compiler"""
+    by_name: dict[str, list[str]] = {}
+    for f in files:
+        by_name.setdefault(posixpath.basename(f), []).append(f)
+    others = {t.platform_dir for t in TARGETS.values()} - {target.platform_dir}
+
+    def preference(path: str):
+        parts = path.split("/")
+        return (0 if target.platform_dir in parts else 2 if others.intersection(parts) else 1, len(parts), path)
+
+    dirs: list[str] = []
+    scanned: set[str] = set()
+    pending = deque((name, None) for name in headers)
+    while pending:
+        name, includer = pending.popleft()
+        resolved = None
+        if includer is not None:
+            # Quoted includes are looked for next to the file first and need no directory
+            nearby = posixpath.normpath(posixpath.join(posixpath.dirname(includer), name))
+            if nearby in files:
+                resolved = nearby
+        if resolved is None:
+            resolved = next((posixpath.join(d, name) for d in dirs if posixpath.join(d, name) in files), None)
+        if resolved is None:
+            candidates = [f for f in by_name.get(posixpath.basename(name), ()) if f.endswith("/" + name)]
+            if not candidates:
+                continue
+            resolved = min(candidates, key=preference)
+            dirs.append(resolved[: -len(name) - 1])
+        if resolved in scanned:
+            continue
+        scanned.add(resolved)
+        code = (Path(root) / resolved).read_text(encoding="utf-8", errors="replace")
+        pending.extend((included, resolved) for _, included in INCLUDE_RE.findall(code))
+    return dirs
+
+
+def compile_commands(root: Path, sources: list[str], include_dirs: list[str], target: Target) -> list[dict]:
+    arguments = [
+        "clang++",
+        f"--target={target.triple}",
+        "-std=c++17",
+        *[f"-D{d}" for d in target.defines],
+        *[f"-I{root / d}" for d in include_dirs],
+    ]
+    return [
+        {"directory": str(root), "file": str(root / s), "arguments": [*arguments, "-c", str(root / s)]}
+        for s in sources
+    ]
+
+
+def vscode_configuration(platform: str, include_dirs: list[str], target: Target) -> dict:
+    configuration = {
+        "name": target.name,
+        "includePath": ["${workspaceFolder}/" + d for d in include_dirs],
+        "defines": list(target.defines),
+        "compileCommands": f"${{workspaceFolder}}/{PER_PLATFORM_DIR}/{platform}/{COMPILE_COMMANDS}",
+        "cStandard": "c17",
+        "cppStandard": "c++17",
+        "intelliSenseMode": target.intellisense,
+    }
+    if platform == "win":
+        configuration.update({"windowsSdkVersion": "10.0.19041.0", "compilerPath": "cl.exe"})
+    return configuration
+
+
+def write_editor_configs(output: Output, root: Union[str, Path], sources: list[str], headers: list[str]):
+    """Writes the compile databases and `.vscode/c_cpp_properties.json`. `root`
+    is where the tree ends up (the databases need absolute paths), `headers`
+    are the ones includes.h includes with <>"""
+    root = Path(root).resolve()
+    files = cocos2d_headers(root)
+    configurations = []
+    for platform, target in TARGETS.items():
+        found = find_include_dirs(root, files, headers, target) if files is not None else FALLBACK_INCLUDE_DIRS
+        include_dirs = ["headers", *found]
+        commands = json.dumps(compile_commands(root, sources, include_dirs, target), indent=1)
+        output.write(f"{PER_PLATFORM_DIR}/{platform}/{COMPILE_COMMANDS}", commands)
+        if platform == host_platform():
+            output.write(COMPILE_COMMANDS, commands)
+        configurations.append(vscode_configuration(platform, include_dirs, target))
+    output.write(".vscode/c_cpp_properties.json", json.dumps({"configurations": configurations, "version": 4}, indent=4))
@@ -0,0 +1,10 @@
+// I'm keeping this one. 7w7
+// Wylie Addition (https://github.com/Wyliemaster/GD-Decompiled/blob/main/GD/code/headers/Layers/LevelSettingsLayer.h)
+enum class Speed {
+	Normal = 0,
+	Slow = 1,
+	Fast = 2,
+	Faster = 3,
+	Fastest = 4,
+};
+
@@ -0,0 +1,16 @@
+
+
+/* I Blame Geode for adding this namespace -_-
+I'm only adding this in to prevent intellisense from complaining 
+to me more , please try not to send me pull requests
+with the gd namespace it's here only if I'm lazily merging 
+class members in and preventing vscode from complining to me
+Unlike geode our goal is to remain accurate to what Robtop is using,
+Not what geode does. Because of that, if you send me pull requests 
+with the namespace of gd anywhere in the src folder, 
+I have every right in the blood of my veins to disown you 
+- Calloc
+*/
+
+namespace gd = std;
+
@@ -0,0 +1,13 @@
+
+
+#ifndef PASS
+    /* Function will not be decompiled yet due to **Certain Defined Restraints** Specified by `Reason` */
+    #define PASS(Func, Reason) Func{return;};
+#endif
+
+#ifndef NOOP
+    /* Function has No Operations Involved */
+    #define NOOP(Func) Func{};
+#endif
+
+
@@ -0,0 +1,153 @@
+"""Runs clang-format over the generated files while they are being written.
+Every file is handed to a clang-format process from a bounded pool and what it
+made is cached by a hash of the input, the clang-format version and the
+`.clang-format` of the output, so only files the generator actually changed
+ever reach clang-format. Everything else comes straight out of the cache...
+
+    decomp-deploy generate --format
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .output import Output, atomic_write
+
+FORMAT_CACHE = "format-cache"
+
+STYLE_FILE = ".clang-format"
+
+# Only these go through clang-format, the json next to them (compile databases, shard manifests) is passed on as it is
+FORMATTED_SUFFIXES = (".h", ".hpp", ".cpp")
+
+
+def find_clang_format(path: Optional[str] = None) -> Optional[str]:
+    """The clang-format binary that was asked for or the one on PATH, None when there isn't one"""
+    return shutil.which(path or "clang-format")
+
+
+class Formatter:
+    """clang-format along with the cache of everything it formatted before.
+    `root` is where the files end up, it's `.clang-format` is the style. At most
+    `jobs` clang-format processes run at once"""
+
+    def __init__(self, binary: str, root: Union[str, Path] = ".", cache: Union[str, Path] = FORMAT_CACHE, jobs: int = None) -> None:
+        self.binary = binary
+        self.root = Path(root)
+        self.cache = Path(cache)
+        self.jobs = jobs or os.cpu_count() or 1
+        version = subprocess.run([binary, "--version"], capture_output=True, check=True).stdout
+        style = self.root / STYLE_FILE
+        # Any other version or style formats differently so neither of them can share entries
+        self.fingerprint = hashlib.sha256(version + b"\0" + (style.read_bytes() if style.exists() else b"")).digest()
+
+    def key(self, path: str, data: bytes) -> str:
+        # The extension decides if clang-format sees C or C++ (and Objective-C...)
+        return hashlib.sha256(self.fingerprint + os.path.splitext(path)[1].encode("utf-8") + b"\0" + data).hexdigest()
+
+    def cached(self, key: str) -> Optional[bytes]:
+        try:
+            return (self.cache / key[:2] / key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def format(self, path: str, data: bytes, key: str) -> bytes:
+        """Formats one file, the name it's given is where it will be so clang-format finds the style"""
+        result = subprocess.run(
+            [self.binary, "-style=file", f"-assume-filename={self.root / path}"],
+            input=data,
+            capture_output=True,
+            check=True,
+        )
+        entry = self.cache / key[:2] / key
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(entry, result.stdout)
+        return result.stdout
+
+
+class FormattingOutput(Output):
+    """Formats the C++ files on their way to `inner`. Files in the cache are
+    passed on right away, the rest go to the formatter's clang-format processes.
+    A file clang-format chokes on is written as it was generated"""
+
+    def __init__(self, inner: Output, formatter: Formatter) -> None:
+        super().__init__()
+        self.inner = inner
+        self.formatter = formatter
+        self.pool = ThreadPoolExecutor(formatter.jobs)
+        # Keeps the files waiting on clang-format (and their memory) bounded
+        self.slots = threading.BoundedSemaphore(formatter.jobs * 4)
+        # The archive and git backends can only be written from one thread at a time
+        self.lock = threading.Lock()
+        self.pending: list[Future] = []
+        self.formatted = 0
+        self.cached = 0
+        self.failed = 0
+
+    def _pass_on(self, path: str, data: bytes, counter: str = None):
+        with self.lock:
+            if counter is not None:
+                setattr(self, counter, getattr(self, counter) + 1)
+            self.inner.write_bytes(path, data)
+
+    def _format(self, path: str, data: bytes, key: str):
+        try:
+            try:
+                formatted = self.formatter.format(path, data, key)
+            except (OSError, subprocess.CalledProcessError) as e:
+                stderr = getattr(e, "stderr", None)
+                print(f"[!] clang-format failed on {path} ({stderr.decode(errors='replace').strip() if stderr else e}), it's left unformatted")
+                self._pass_on(path, data, "failed")
+            else:
+                # Outside the try so a failing output isn't blamed on clang-format
+                self._pass_on(path, formatted, "formatted")
+        finally:
+            self.slots.release()
+
+    def write_bytes(self, path: str, data: bytes):
+        if not path.endswith(FORMATTED_SUFFIXES):
+            self._pass_on(path, data)
+            return
+        key = self.formatter.key(path, data)
+        if (formatted := self.formatter.cached(key)) is not None:
+            self._pass_on(path, formatted, "cached")
+            return
+        self.slots.acquire()
+        self.pending.append(self.pool.submit(self._format, path, data, key))
+
+    def plan(self, directories: Iterable[str]):
+        self.inner.plan(directories)
+
+    def _wait(self):
+        self.pool.shutdown(wait=True)
+        # Raises whatever went wrong in the inner output
+        for future in self.pending:
+            future.result()
+        self.pending = []
+
+    def _summary(self):
+        print(f"[+] Formatted {self.formatted} files with clang-format, {self.cached} were already in the cache" + (f" and {self.failed} failed" if self.failed else ""))
+
+    def close(self):
+        self._wait()
+        self.inner.close()
+        self._summary()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.inner.__exit__(exc_type, exc, tb)
+            return
+        try:
+            self._wait()
+        except BaseException as e:
+            # The inner output decides what a failure means for it (StagedOutput throws everything away)
+            self.inner.__exit__(type(e), e, e.__traceback__)
+            raise
+        self.inner.__exit__(None, None, None)
+        self._summary()
@@ -0,0 +1,192 @@
+"""A record of every file and directory the generator made inside of an output
+root (`.decomp-manifest.json`), every run adds to it and `clean --uninstall`
+removes exactly what's in it without walking the tree. Anything that isn't in
+the manifest (the user's own files) is never touched and directories are only
+removed once they're empty..."""
+
+import json
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Union
+
+from .output import atomic_write
+
+MANIFEST_FILE = ".decomp-manifest.json"
+
+# Bump this whenever the json below changes
+MANIFEST_VERSION = 1
+
+# Held while a process reads and writes the manifest, `watch` and `generate` can run next to each other
+LOCK_FILE = ".decomp-manifest.lock"
+
+# Seconds after which a lock file is taken to be left behind by a process that died holding it
+LOCK_STALE = 60.0
+
+# cocos2d is unpacked while the tree is being generated, both update the same manifest
+_lock = threading.Lock()
+
+
+@contextmanager
+def locked(root: Union[str, Path] = "."):
+    """Keeps every other thread and process away from the manifest of `root`"""
+    path = Path(root) / LOCK_FILE
+    with _lock:
+        while True:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - path.stat().st_mtime > LOCK_STALE:
+                        path.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            path.unlink(missing_ok=True)
+
+
+class Manifest:
+    """Paths are relative posix paths from `root`"""
+
+    def __init__(self, root: Union[str, Path] = ".") -> None:
+        self.root = Path(root)
+        self.files: set[str] = set()
+        self.directories: set[str] = set()
+
+    @property
+    def path(self) -> Path:
+        return self.root / MANIFEST_FILE
+
+    @classmethod
+    def load(cls, root: Union[str, Path] = ".") -> "Manifest":
+        """The manifest of `root`, an empty one if nothing was generated there yet"""
+        manifest = cls(root)
+        if not manifest.path.exists():
+            return manifest
+        with open(manifest.path, "r", encoding="utf-8") as r:
+            data = json.load(r)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"{manifest.path} was made by another version of the generator")
+        manifest.files = set(data["files"])
+        manifest.directories = set(data["directories"])
+        return manifest
+
+    def save(self):
+        if not self.files and not self.directories:
+            self.path.unlink(missing_ok=True)
+            return
+        data = {"version": MANIFEST_VERSION, "files": sorted(self.files), "directories": sorted(self.directories)}
+        atomic_write(self.path, json.dumps(data, indent=1).encode("utf-8"))
+
+    def add(self, files: Iterable[str]):
+        """Adds files along with every directory above them"""
+        for name in files:
+            self.files.add(name)
+            d = posixpath.dirname(name)
+            while d and d not in self.directories:
+                self.directories.add(d)
+                d = posixpath.dirname(d)
+
+    def add_paths(self, paths: Iterable[Union[str, Path]]):
+        """Adds real paths, anything outside of the root isn't ours to track"""
+        root = self.root.resolve()
+        names = []
+        for p in paths:
+            try:
+                names.append(Path(p).resolve().relative_to(root).as_posix())
+            except ValueError:
+                continue
+        self.add(names)
+
+    def prune(self, trees: Iterable[str], keep: Iterable[str]):
+        """Removes the files inside of `trees` that were generated last time but
+        aren't in `keep` anymore, along with the directories that leaves empty.
+        Files of the user's in there were never in the manifest so they stay"""
+        prefixes = tuple(t + "/" for t in trees)
+        if not prefixes:
+            return
+        keep = set(keep)
+        for name in [f for f in self.files if f.startswith(prefixes) and f not in keep]:
+            try:
+                os.unlink(self.root / name)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            self.files.discard(name)
+        for d in sorted((d for d in self.directories if d.startswith(prefixes)), key=lambda d: d.count("/"), reverse=True):
+            try:
+                os.rmdir(self.root / d)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Still has files in it, new ones or someone else's
+                continue
+            self.directories.discard(d)
+
+    def remove(self, workers: int = 16) -> tuple[int, int]:
+        """Removes every file (from `workers` threads) and then every directory
+        that ended up empty, deepest first. Whatever couldn't be removed stays in
+        the manifest. Returns how many files and directories were removed"""
+        files = sorted(self.files)
+        root = str(self.root)
+
+        def unlink(names: list[str]) -> list[str]:
+            failed = []
+            for name in names:
+                try:
+                    os.unlink(os.path.join(root, name))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    failed.append(name)
+            return failed
+
+        workers = max(1, min(workers, len(files) // 256 + 1))
+        chunks = [files[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(workers) as pool:
+            failed = {name for names in pool.map(unlink, chunks) for name in names}
+        self.files = failed
+
+        removed_directories = 0
+        for d in sorted(self.directories, key=lambda d: d.count("/"), reverse=True):
+            try:
+                os.rmdir(os.path.join(root, d))
+                removed_directories += 1
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Not empty, someone else's files are in there
+                continue
+            self.directories.discard(d)
+
+        self.save()
+        return len(files) - len(failed), removed_directories
+
+
+def record(root: Union[str, Path], files: Iterable[str], replaced: Iterable[str] = ()):
+    """Adds `files` to the manifest of `root`, what was generated in the
+    `replaced` trees before and isn't one of `files` anymore is removed"""
+    files = list(files)
+    with locked(root):
+        manifest = Manifest.load(root)
+        manifest.prune(replaced, files)
+        manifest.add(files)
+        manifest.save()
+
+
+def record_paths(root: Union[str, Path], paths: Iterable[Union[str, Path]]):
+    """`record` for real paths such as symbols.db, the ones outside of `root` are skipped"""
+    with locked(root):
+        manifest = Manifest.load(root)
+        manifest.add_paths(paths)
+        manifest.save()
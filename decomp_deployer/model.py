@@ -0,0 +1,185 @@
+"""A small picklable model of the bindings. pybroma's objects are walked exactly
+once and turned into plain named tuples so that the writers never have to go
+back through the C-extension accessors (or keep the whole parse tree alive)
+and so that the model can be cached on disk or handed to other processes..."""
+
+from pathlib import Path
+from typing import NamedTuple, Union
+
+
+# Not every version of the bindings has every platform, missing ones are skipped
+PLATFORMS = ("win", "imac", "m1", "ios", "android32", "android64", "mac", "android")
+
+# Bump this whenever the tuples below change so that old caches are thrown out
+MODEL_VERSION = 1
+
+BINDINGS_FILES = ("Cocos2d.bro", "GeometryDash.bro", "Extras.bro")
+
+# The broma files glued together for pybroma and the model made out of them
+CONCAT_CACHE = "_temp.bro"
+MODEL_CACHE = "_temp.model"
+
+# pybroma or the built-in parser in broma.py, both make the exact same model
+PARSERS = ("pybroma", "python")
+
+
+class Type(NamedTuple):
+    name: str
+    is_struct: bool = False
+
+
+class FunctionProto(NamedTuple):
+    name: str
+    ret: Type
+    args: tuple[tuple[str, Type], ...] = ()
+    is_virtual: bool = False
+    is_static: bool = False
+    is_const: bool = False
+
+
+class FunctionBindField(NamedTuple):
+    prototype: FunctionProto
+    binds: tuple[tuple[str, int], ...] = ()
+    """(platform, address) pairs for every platform that has an address"""
+
+
+class MemberField(NamedTuple):
+    name: str
+    type: Type
+
+
+class PadField(NamedTuple):
+    amount: tuple[tuple[str, int], ...] = ()
+    """(platform, size) pairs"""
+
+
+class Class(NamedTuple):
+    name: str
+    superclasses: tuple[str, ...] = ()
+    fields: tuple[Union[FunctionBindField, MemberField, PadField], ...] = ()
+
+    @property
+    def functions(self) -> list[FunctionProto]:
+        return [f.prototype for f in self.fields if type(f) is FunctionBindField]
+
+
+class ModelVisitor:
+    """Walks the model the same way pybroma's BromaTreeVisitor walks it's tree"""
+
+    def start(self, classes: list[Class]):
+        for c in classes:
+            self.visit_Class(c)
+
+    def visit_Class(self, node: Class):
+        for field in node.fields:
+            self.visit_Field(field)
+
+    def visit_Field(self, node: Union[FunctionBindField, MemberField, PadField]):
+        t = type(node)
+        if t is FunctionBindField:
+            self.visit_FunctionBindField(node)
+        elif t is MemberField:
+            self.visit_MemberField(node)
+        elif t is PadField:
+            self.visit_PadField(node)
+
+    def visit_FunctionBindField(self, node: FunctionBindField):
+        pass
+
+    def visit_MemberField(self, node: MemberField):
+        pass
+
+    def visit_PadField(self, node: PadField):
+        pass
+
+
+def platform_numbers(number) -> tuple[tuple[str, int], ...]:
+    """Turns a broma PlatformNumber into (platform, value) pairs skipping the unset ones (-1)"""
+    if number is None:
+        return ()
+    values = []
+    for p in PLATFORMS:
+        v = getattr(number, p, None)
+        if isinstance(v, int) and v >= 0:
+            values.append((p, v))
+    return tuple(values)
+
+
+def from_pybroma(root) -> list[Class]:
+    """Converts a parsed pybroma Root into the model in a single pass"""
+    types: dict[tuple[str, bool], Type] = {}
+
+    def _type(t) -> Type:
+        # The same few hundred types are used over and over so share them...
+        key = (t.name, bool(t.is_struct))
+        if (cached := types.get(key)) is None:
+            cached = types[key] = Type(*key)
+        return cached
+
+    classes = []
+    for node in root.classes:
+        fields = []
+        for field in node.fields:
+            if (f := field.getAsFunctionBindField()) is not None:
+                proto = f.prototype
+                fields.append(FunctionBindField(
+                    FunctionProto(
+                        proto.name,
+                        _type(proto.ret),
+                        tuple((a, _type(t)) for a, t in proto.args.items()),
+                        bool(proto.is_virtual),
+                        bool(proto.is_static),
+                        bool(proto.is_const),
+                    ),
+                    platform_numbers(getattr(f, "binds", None)),
+                ))
+            elif (m := field.getAsMemberField()) is not None:
+                fields.append(MemberField(m.name, _type(m.type)))
+            elif (p := field.getAsPadField()) is not None:
+                fields.append(PadField(platform_numbers(p.amount)))
+        classes.append(Class(node.name, tuple(node.superclasses), tuple(fields)))
+    return classes
+
+
+def default_parser() -> str:
+    """pybroma when it's installed, otherwise the built-in parser"""
+    from importlib.util import find_spec
+
+    return "pybroma" if find_spec("pybroma") is not None else "python"
+
+
+def parse_bindings(path: Union[str, Path], parser: str = None) -> list[Class]:
+    """Parses a broma file into the model with `parser` (one of PARSERS), by
+    default pybroma is used if it's installed"""
+    if parser is None:
+        parser = default_parser()
+    if parser == "python":
+        from .broma import parse_file
+
+        return parse_file(path)
+    if parser != "pybroma":
+        raise ValueError(f"unknown parser {parser!r}, expected one of {', '.join(PARSERS)}")
+
+    from pybroma.PyBroma import Root
+
+    return from_pybroma(Root(str(path)))
+
+
+def save_model(classes: list[Class], path: Union[str, Path]):
+    # The cli only wants the names above from here, output.py pulls in tarfile, zipfile and subprocess
+    import pickle
+    from .output import atomic_write
+
+    atomic_write(path, pickle.dumps((MODEL_VERSION, classes), protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_model(path: Union[str, Path]) -> list[Class]:
+    """Loads a model saved by `save_model`, raises ValueError if it was made by an
+    older version of the model"""
+    import pickle
+
+    with open(path, "rb") as r:
+        version, classes = pickle.load(r)
+    if version != MODEL_VERSION:
+        raise ValueError(f"{path} was made by an older version of the generator")
+    return classes
@@ -0,0 +1,496 @@
+"""Places where the generated decomp tree can be written to. Every file the writer
+makes goes through one of these so that we are not stuck with thousands of tiny
+files on the real filesystem when all we wanted was an artifact..."""
+
+import hashlib
+import os
+import posixpath
+import queue
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, Union
+
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.xz", ".tar.bz2")
+
+# `git:<repository>[#<branch>]` targets are committed straight into a branch
+GIT_PREFIX = "git:"
+
+GIT_BRANCH = "decomp"
+
+
+def partial_path(path: Union[str, Path]) -> Path:
+    """A name next to `path` that no other process will use for it"""
+    path = Path(path)
+    return path.with_name(f".{path.name}.{os.getpid()}.{time.monotonic_ns()}.partial")
+
+
+def atomic_write(path: Union[str, Path], data: bytes):
+    """Anyone reading `path` either sees the old contents or all of the new ones"""
+    partial = partial_path(path)
+    try:
+        with open(partial, "wb") as w:
+            w.write(data)
+        os.replace(partial, path)
+    finally:
+        if partial.exists():
+            partial.unlink()
+
+
+class Output:
+    """Base class for all the output backends. Paths are always relative posix
+    paths such as `headers/Layers/PlayLayer.h`"""
+
+    def __init__(self) -> None:
+        self.files_written = 0
+        self.bytes_written = 0
+
+    def write(self, path: str, content: str):
+        """Writes a generated text file to the backend"""
+        data = content.encode("utf-8")
+        self.files_written += 1
+        self.bytes_written += len(data)
+        self.write_bytes(path, data)
+
+    def write_bytes(self, path: str, data: bytes):
+        raise NotImplementedError
+
+    def plan(self, directories: Iterable[str]):
+        """Told every directory that files are about to be written into before
+        any of them are, backends without real directories have nothing to do"""
+
+    def flush(self):
+        """Makes what was written so far stick for backends that stay open
+        (the watcher's), most of them have nothing to do here"""
+
+    def close(self):
+        """Flushes everything out, some backends have nothing to do here..."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class DirectoryOutput(Output):
+    """Writes everything to a real directory, this is the original behavior of the tool"""
+
+    def __init__(self, root: Union[str, Path] = ".") -> None:
+        super().__init__()
+        self.root = Path(root)
+        # Directories that are known to exist so files never have to check for (or make) their parent
+        self.directories: set[str] = set()
+        # Everything written goes into the manifest once closed so `clean --uninstall` can remove it again
+        self.written: list[str] = []
+
+    def plan(self, directories: Iterable[str]):
+        for d in sorted(directories):
+            if d in self.directories:
+                continue
+            os.makedirs(os.path.join(self.root, d), exist_ok=True)
+            while True:
+                self.directories.add(d)
+                if not d:
+                    break
+                d = posixpath.dirname(d)
+
+    def write_bytes(self, path: str, data: bytes):
+        parent = path.rpartition("/")[0]
+        if parent not in self.directories:
+            # Something that wasn't planned for, make it once and remember it...
+            self.plan((parent,))
+        # TODO: Warn about User about the dangers overriding previous files inorder to save their
+        # own project if something was written in by hand...
+        with open(os.path.join(self.root, path), "wb") as w:
+            w.write(data)
+        self.written.append(path)
+
+    def flush(self):
+        if self.written:
+            from .manifest import record
+
+            record(self.root, self.written)
+            self.written = []
+
+    def close(self):
+        self.flush()
+
+
+class StagedOutput(DirectoryOutput):
+    """Writes the tree into a private staging directory inside of `root` and only
+    moves it into place once everything was written, so a failed run leaves the
+    old tree alone and never half of a new one.
+
+    Every file is moved in on it's own with a rename, so files of the user's
+    next to them are never touched. Each rename is atomic but the move as a
+    whole isn't, the files it replaces are kept aside until the last one is in
+    place and put back if anything fails on the way. What the last run
+    generated in `trees` that this one didn't (a class that's gone or moved to
+    another category) is removed with the help of the manifest"""
+
+    trees = ("headers", "src")
+
+    def __init__(self, root: Union[str, Path] = ".") -> None:
+        self.target = Path(root)
+        self.target.mkdir(parents=True, exist_ok=True)
+        # Same filesystem as the target so that the renames stay renames...
+        super().__init__(tempfile.mkdtemp(prefix=".staging-", dir=self.target))
+
+    def close(self):
+        if not self.root.exists():
+            return
+        from .manifest import record
+
+        paths = list(dict.fromkeys(self.written))
+        # The files being replaced wait in here until every new one is in place
+        backup = Path(tempfile.mkdtemp(prefix=".replaced-", dir=self.target))
+        moved: list[tuple[str, bool]] = []
+        created: list[Path] = []
+        restored = True
+        try:
+            for d in sorted({path.rpartition("/")[0] for path in paths}):
+                parent = self.target / d
+                while not parent.exists():
+                    created.append(parent)
+                    parent = parent.parent
+                os.makedirs(self.target / d, exist_ok=True)
+            for path in paths:
+                dest = self.target / path
+                kept = dest.exists()
+                if kept:
+                    (backup / path).parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(dest, backup / path)
+                moved.append((path, kept))
+                # os.replace overwrites on windows as well, unlike os.rename
+                os.replace(self.root / path, dest)
+        except BaseException:
+            restored = self._roll_back(moved, created, backup)
+            raise
+        else:
+            record(self.target, paths, {path.partition("/")[0] for path in paths} & set(self.trees))
+        finally:
+            if restored:
+                shutil.rmtree(backup, ignore_errors=True)
+            self.discard()
+
+    def _roll_back(self, moved: list[tuple[str, bool]], created: list[Path], backup: Path) -> bool:
+        """Puts back what a failed close already replaced, returns False (and
+        leaves `backup` alone) when some of it couldn't be"""
+        failed = []
+        for path, kept in reversed(moved):
+            dest = self.target / path
+            try:
+                if kept:
+                    os.replace(backup / path, dest)
+                else:
+                    dest.unlink(missing_ok=True)
+            except OSError:
+                failed.append(path)
+        for d in sorted(created, key=lambda d: len(d.parts), reverse=True):
+            try:
+                d.rmdir()
+            except OSError:
+                pass
+        if failed:
+            print(f"[!] {len(failed)} files couldn't be put back after a failed move, the old ones are still in {backup}")
+        return not failed
+
+    def flush(self):
+        # Nothing is in place before close
+        pass
+
+    def discard(self):
+        """Throws away everything that was staged"""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+
+class ArchiveOutput(Output):
+    """Streams everything into a single zip or tar archive so that producing an
+    artifact is one sequential write instead of one file per class. The archive
+    is written under a temporary name and renamed once it's complete..."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.partial = partial_path(self.path)
+        name = self.path.name.lower()
+        self._zip = None
+        self._tar = None
+        if name.endswith(".zip"):
+            self._zip = zipfile.ZipFile(self.partial, "w", zipfile.ZIP_DEFLATED)
+        elif name.endswith(".tar"):
+            self._tar = tarfile.open(str(self.partial), "w|")
+        elif name.endswith((".tar.gz", ".tgz")):
+            self._tar = tarfile.open(str(self.partial), "w|gz")
+        elif name.endswith(".tar.xz"):
+            self._tar = tarfile.open(str(self.partial), "w|xz")
+        elif name.endswith(".tar.bz2"):
+            self._tar = tarfile.open(str(self.partial), "w|bz2")
+        else:
+            raise ValueError(f"Unknown archive type for {self.path} (expected one of {', '.join(ARCHIVE_SUFFIXES)})")
+        self._mtime = time.time()
+
+    def write_bytes(self, path: str, data: bytes):
+        if self._zip is not None:
+            self._zip.writestr(path, data)
+        else:
+            info = tarfile.TarInfo(path)
+            info.size = len(data)
+            info.mtime = self._mtime
+            info.mode = 0o644
+            self._tar.addfile(info, BytesIO(data))
+
+    def _finish(self) -> bool:
+        if self._zip is None and self._tar is None:
+            return False
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+        return True
+
+    def close(self):
+        if self._finish():
+            os.replace(self.partial, self.path)
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        elif self._finish():
+            # Half an archive is worse than the one from last time
+            self.partial.unlink()
+
+
+class GitOutput(Output):
+    """Streams the tree into `git fast-import` and commits it to `branch` of
+    `repository` without ever touching a working tree, so publishing a
+    regenerated tree is one pipe instead of writing thousands of files and
+    running `git add` over them. The repository is made if it doesn't exist.
+
+    Files whose blob hash matches the one already on the branch aren't sent
+    at all, they point at the old blob. With `replace` the `trees` that were
+    written to replace the old ones as a whole like `StagedOutput` does,
+    otherwise the files are only added on top. When nothing changed no commit
+    is made..."""
+
+    trees = StagedOutput.trees
+
+    def __init__(self, repository: Union[str, Path], branch: str = GIT_BRANCH, message: str = "Regenerate the decomp tree", replace: bool = True) -> None:
+        super().__init__()
+        self.repository = Path(repository)
+        self.branch = branch
+        self.message = message
+        self.replace = replace
+        if not self.repository.exists():
+            self._git("init", "-q", str(self.repository), cwd=None)
+        self.parent = self._git("rev-parse", "--verify", "-q", f"refs/heads/{branch}^{{commit}}", check=False)
+        self.old: dict[str, str] = {}
+        if self.parent:
+            for entry in self._git("ls-tree", "-r", "-z", self.parent).split("\0"):
+                if entry:
+                    info, _, path = entry.partition("\t")
+                    self.old[path] = info.split()[2]
+        # Path to what it points at, a mark of a new blob or the sha of an old one
+        self.files: dict[str, str] = {}
+        self.changed = 0
+        self._marks = 0
+        self._process = subprocess.Popen(
+            ["git", "fast-import", "--quiet", "--done"], cwd=self.repository, stdin=subprocess.PIPE
+        )
+
+    def _git(self, *args: str, cwd: Union[str, Path, None] = "", check: bool = True) -> str:
+        result = subprocess.run(
+            ["git", *args], cwd=self.repository if cwd == "" else cwd, capture_output=True, text=True
+        )
+        if check and result.returncode:
+            raise OSError(f"git {args[0]} failed in {self.repository}: {result.stderr.strip()}")
+        return result.stdout.strip() if not result.returncode else ""
+
+    def write_bytes(self, path: str, data: bytes):
+        sha = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+        if self.old.get(path) == sha:
+            self.files[path] = sha
+            return
+        self._marks += 1
+        self._process.stdin.write(b"blob\nmark :%d\ndata %d\n" % (self._marks, len(data)) + data + b"\n")
+        self.files[path] = f":{self._marks}"
+        self.changed += 1
+
+    def _committer(self) -> str:
+        if ident := self._git("var", "GIT_COMMITTER_IDENT", check=False):
+            return ident
+        return f"decomp-deploy <decomp-deploy@localhost> {int(time.time())} +0000"
+
+    def _finish(self) -> bool:
+        """Writes the commit unless it would be the same tree as the last one, returns if it was made"""
+        replaced = {p.partition("/")[0] for p in self.files} & set(self.trees) if self.replace else set()
+        removed = [p for p in self.old if p.partition("/")[0] in replaced and p not in self.files]
+        if not self.changed and not removed:
+            return False
+        message = self.message.encode("utf-8")
+        commands = [
+            f"commit refs/heads/{self.branch}".encode("utf-8"),
+            f"committer {self._committer()}".encode("utf-8"),
+            b"data %d\n" % len(message) + message,
+        ]
+        if self.parent:
+            commands.append(f"from {self.parent}".encode("utf-8"))
+        commands.extend(f"D {name}".encode("utf-8") for name in sorted(replaced))
+        commands.extend(f"M 100644 {ref} {path}".encode("utf-8") for path, ref in sorted(self.files.items()))
+        self._process.stdin.write(b"\n".join(commands) + b"\n\n")
+        return True
+
+    def close(self):
+        if self._process.stdin.closed:
+            return
+        committed = self._finish()
+        self._process.stdin.write(b"done\n")
+        self._process.stdin.close()
+        if self._process.wait():
+            raise OSError(f"git fast-import failed in {self.repository}")
+        if committed:
+            print(f"[+] Committed {self.changed} changed files ({len(self.files) - self.changed} unchanged) to {self.branch} in {self.repository}")
+        else:
+            print(f"[+] Nothing changed since the last commit on {self.branch}, no commit was made")
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        elif not self._process.stdin.closed:
+            # Without `done` fast-import gives up and the branch stays where it was
+            self._process.stdin.close()
+            self._process.wait()
+
+
+class ThreadedOutput(Output):
+    """Hands every file over to a few writer threads through a bounded queue so
+    that rendering the next class overlaps with writing the last one. When the
+    writers fall behind `write` blocks until there's room again, so memory use
+    stays at about `queue_size` files no matter how big the tree is...
+
+    Errors from the writers are raised by the next `write` or by `close`"""
+
+    def __init__(self, inner: Output, workers: int = 4, queue_size: int = 256) -> None:
+        super().__init__()
+        self.inner = inner
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.errors: list[BaseException] = []
+        self.threads = [threading.Thread(target=self._work, daemon=True) for _ in range(max(1, workers))]
+        for t in self.threads:
+            t.start()
+
+    def _work(self):
+        while (item := self.queue.get()) is not None:
+            if self.errors:
+                # Something already went wrong, just drain the queue
+                continue
+            try:
+                self.inner.write_bytes(*item)
+            except BaseException as e:  # pylint: disable=broad-except
+                self.errors.append(e)
+
+    def write_bytes(self, path: str, data: bytes):
+        if self.errors:
+            raise self.errors[0]
+        self.queue.put((path, data))
+
+    def plan(self, directories: Iterable[str]):
+        self.inner.plan(directories)
+
+    def _stop(self):
+        if not self.threads:
+            return
+        for _ in self.threads:
+            self.queue.put(None)
+        for t in self.threads:
+            t.join()
+        self.threads = []
+
+    def close(self):
+        self._stop()
+        self.inner.close()
+        if self.errors:
+            raise self.errors[0]
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop()
+        if exc is None and self.errors:
+            exc = self.errors[0]
+        # The inner output decides what a failure means for it (StagedOutput throws everything away)
+        self.inner.__exit__(type(exc) if exc is not None else None, exc, tb)
+        if exc_type is None and exc is not None:
+            raise exc
+
+
+class TeeOutput(Output):
+    """Writes everything to several backends at once, the artifact cache packs
+    the tree up with it while it's being written. The backends are closed by
+    whoever opened them"""
+
+    def __init__(self, *outputs: Output) -> None:
+        super().__init__()
+        self.outputs = outputs
+
+    def write_bytes(self, path: str, data: bytes):
+        for output in self.outputs:
+            output.write_bytes(path, data)
+
+    def plan(self, directories: Iterable[str]):
+        directories = list(directories)
+        for output in self.outputs:
+            output.plan(directories)
+
+
+class MemoryOutput(Output):
+    """Keeps the whole tree in memory as a dictionary of paths to text, mainly for testing things..."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.files: dict[str, str] = {}
+
+    def write(self, path: str, content: str):
+        self.files_written += 1
+        self.bytes_written += len(content.encode("utf-8"))
+        self.files[path] = content
+
+    def write_bytes(self, path: str, data: bytes):
+        self.write(path, data.decode("utf-8"))
+
+
+def open_output(target: Union[str, Path, None] = None, staged: bool = False, writers: int = 0) -> Output:
+    """Picks the backend based on what the target looks like, archives by their
+    suffix, `git:<repository>[#<branch>]` into a git branch and anything else is
+    treated as a directory. `staged` directories only get the tree once it was
+    completely written (see `StagedOutput`) and with `writers` the files are
+    written from that many threads"""
+    if target is None:
+        target = "."
+    if str(target).startswith(GIT_PREFIX):
+        repository, _, branch = str(target)[len(GIT_PREFIX):].partition("#")
+        # Only a complete tree (the ones that would be staged) replaces what's on the branch
+        output = GitOutput(repository or ".", branch or GIT_BRANCH, replace=staged)
+        # fast-import reads one stream as well
+        writers = min(writers, 1)
+    elif str(target).lower().endswith(ARCHIVE_SUFFIXES):
+        output = ArchiveOutput(target)
+        # An archive is one stream, more than one thread writing to it gets us nowhere...
+        writers = min(writers, 1)
+    else:
+        output = StagedOutput(target) if staged else DirectoryOutput(target)
+    return ThreadedOutput(output, writers) if writers else output
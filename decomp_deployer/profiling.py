@@ -0,0 +1,139 @@
+"""Timing and resource instrumentation for a whole run so that we can tell where
+the time actually goes (downloading, parsing, visiting or writing) and track it
+across runs with a json report..."""
+
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    import resource
+except ImportError:
+    # Windows doesn't have it, peak rss will be reported as null there...
+    resource = None
+
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes while macos reports bytes...
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class Profiler:
+    """Collects per-phase wall and cpu timers as well as counters such as bytes
+    downloaded and written. Phases with the same name are accumulated.
+
+    NOTE: cpu time is process wide, so phases that run concurrently on the
+    event loop (both downloads for instance) will both see each other's cpu time.
+    cProfile and pyinstrument only see the thread they were started on, work
+    that should show up in the profile has to run there"""
+
+    def __init__(self, profiler: Optional[str] = None) -> None:
+        self.phases: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+        self.profiler = profiler
+        self._profile = None
+        # Highest traced memory of every phase that's still running on each thread, innermost last
+        self._local = threading.local()
+
+        if profiler == "cprofile":
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        elif profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler as _Pyinstrument
+            except ImportError as e:
+                raise RuntimeError("pyinstrument is not installed, try `pip install pyinstrument` or use cprofile instead") from e
+            self._profile = _Pyinstrument(async_mode="enabled")
+            self._profile.start()
+        elif profiler is not None:
+            raise ValueError(f"Unknown profiler {profiler!r} (expected one of {', '.join(PROFILERS)})")
+
+    @property
+    def _peaks(self) -> list[int]:
+        if not hasattr(self._local, "peaks"):
+            self._local.peaks = []
+        return self._local.peaks
+
+    @contextmanager
+    def phase(self, name: str):
+        """Times everything inside of the with block under `name`. While tracemalloc
+        is tracing the peak of traced memory during the phase and how much of it
+        was still held afterwards (`retained`, can be negative) are kept too"""
+        # tracemalloc takes a while to import, whoever started tracing has it imported already
+        tracemalloc = sys.modules.get("tracemalloc")
+        tracing = tracemalloc is not None and tracemalloc.is_tracing()
+        if tracing:
+            before, peak = tracemalloc.get_traced_memory()
+            # The peak is reset for every phase, the one around it still needs to see what it was so far
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(0)
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield self
+        finally:
+            p = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+            p["wall"] += time.perf_counter() - wall
+            p["cpu"] += time.process_time() - cpu
+            p["calls"] += 1
+            if tracing:
+                inner = self._peaks.pop()
+            # Someone could have stopped tracing in the middle of the phase
+            if tracing and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, inner)
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                p["peak"] = max(p.get("peak", 0), peak)
+                p["retained"] = p.get("retained", 0) + current - before
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self) -> dict:
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "pid": os.getpid(),
+            "total_wall": time.perf_counter() - self.started,
+            "total_cpu": time.process_time() - self.started_cpu,
+            "peak_rss": peak_rss(),
+            "phases": self.phases,
+            "counters": self.counters,
+        }
+
+    def dump(self, report: Union[str, Path]):
+        """Writes the json report and if a profiler was running, it's dump is
+        placed right next to the report (`.pstats` for cprofile, `.html` for pyinstrument)"""
+        import json
+
+        report = Path(report)
+        if self._profile is not None:
+            if self.profiler == "cprofile":
+                self._profile.disable()
+                self._profile.dump_stats(report.with_suffix(".pstats"))
+            else:
+                self._profile.stop()
+                report.with_suffix(".html").write_text(self._profile.output_html(), encoding="utf-8")
+            self._profile = None
+
+        with open(report, "w", encoding="utf-8") as w:
+            json.dump(self.report(), w, indent=4)
@@ -0,0 +1,124 @@
+"""A pool of proxies for the `Client` to spread it's downloads over, useful when
+there are several egress proxies that aren't equally fast. Every download asks
+the pool for a proxy and tells it how it went afterwards so the pool knows how
+busy, how fast and how healthy each of them is...
+
+Proxies that keep failing are ejected for a while and tried again once their
+cooldown is over, if every proxy is ejected the one that comes back first is
+used anyways so that downloads never just stop."""
+
+import random
+import time
+from typing import Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+STRATEGIES = ("least-loaded", "latency")
+
+# How much the newest latency counts for in the running average
+LATENCY_WEIGHT = 0.3
+
+
+class ProxyStats:
+    """How a single proxy has been doing, an empty url means no proxy at all"""
+
+    __slots__ = ("url", "active", "requests", "failures", "consecutive_failures", "bytes", "seconds", "latency", "ejected_until")
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.active = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        # Running average of the seconds until the response headers arrived, None until the first response
+        self.latency: Optional[float] = None
+        self.ejected_until = 0.0
+
+    @property
+    def name(self) -> str:
+        """The url without any credentials in it, for printing"""
+        if not self.url:
+            return "direct"
+        url = urlsplit(self.url)
+        return url._replace(netloc=url.netloc.rpartition("@")[2]).geturl()
+
+    @property
+    def throughput(self) -> float:
+        """Bytes a second over every download that went through this proxy"""
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+
+class ProxyPool:
+    """Picks a proxy for every download, either the one with the fewest
+    downloads going through it right now (`least-loaded`, ties go to the
+    faster one) or a random one weighted by how quickly it answered so far
+    (`latency`). After `max_failures` failures in a row a proxy is ejected
+    for `cooldown` seconds"""
+
+    def __init__(self, proxies: Union[str, Iterable[str], None] = (), strategy: str = "least-loaded", max_failures: int = 3, cooldown: float = 30.0) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r} (expected one of {', '.join(STRATEGIES)})")
+        if isinstance(proxies, str) or proxies is None:
+            proxies = [proxies] if proxies else []
+        # No proxies at all is a pool of one direct connection
+        self.proxies = [ProxyStats(url) for url in dict.fromkeys(proxies)] or [ProxyStats("")]
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def pick(self, exclude: Iterable[ProxyStats] = ()) -> ProxyStats:
+        """A healthy proxy that isn't in `exclude` (the ones that already failed this download) if there is one"""
+        now = time.monotonic()
+        exclude = set(map(id, exclude))
+        candidates = [p for p in self.proxies if id(p) not in exclude] or self.proxies
+        healthy = [p for p in candidates if not p.ejected(now)]
+        if not healthy:
+            return min(candidates, key=lambda p: p.ejected_until)
+        if len(healthy) == 1:
+            return healthy[0]
+        if self.strategy == "least-loaded":
+            return min(healthy, key=lambda p: (p.active, p.latency or 0.0))
+        # Proxies that haven't answered yet count as the fastest one so they get tried
+        known = [p.latency for p in healthy if p.latency]
+        fastest = min(known) if known else 1.0
+        return random.choices(healthy, [1.0 / (p.latency or fastest) for p in healthy])[0]
+
+    def started(self, proxy: ProxyStats):
+        proxy.active += 1
+        proxy.requests += 1
+
+    def responded(self, proxy: ProxyStats, latency: float):
+        if proxy.latency is None:
+            proxy.latency = latency
+        else:
+            proxy.latency += LATENCY_WEIGHT * (latency - proxy.latency)
+
+    def finished(self, proxy: ProxyStats, downloaded: int, seconds: float):
+        proxy.active -= 1
+        proxy.consecutive_failures = 0
+        proxy.bytes += downloaded
+        proxy.seconds += seconds
+
+    def failed(self, proxy: ProxyStats):
+        proxy.active -= 1
+        proxy.failures += 1
+        proxy.consecutive_failures += 1
+        if proxy.consecutive_failures >= self.max_failures:
+            proxy.ejected_until = time.monotonic() + self.cooldown
+            proxy.consecutive_failures = 0
+            print(f"[!] {proxy.name} failed {self.max_failures} times in a row, not using it for {self.cooldown:g}s")
+
+    def report(self) -> list[str]:
+        """A line for every proxy with how much went through it and how fast"""
+        return [
+            f"{p.name}: {p.requests} requests, {p.failures} failed, {p.bytes / 1024 / 1024:.2f} MiB at {p.throughput / 1024 / 1024:.2f} MiB/s"
+            + (f", {p.latency * 1000:.0f}ms latency" if p.latency is not None else "")
+            for p in self.proxies
+        ]
@@ -0,0 +1,121 @@
+"""The big C++ blobs that end up in includes.h (macros, the gd namespace and the
+enums) live as plain files under `data/` and are only read the first time
+includes.h gets written, a download or a `symbols` lookup never pays for them...
+
+Enums come from geode's `Enums.hpp` when the bindings step managed to grab it
+and from the bundled `data/enums.h` dump when it didn't. Our own additions that
+geode will never have live in `data/enums_extra.h` and are added either way"""
+
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Union
+
+
+DATA = Path(__file__).parent / "data"
+
+# A copy of the bindings for the benchmarks and the stand-in server
+SNAPSHOT = DATA / "snapshot"
+
+# Where the client puts geode's enums next to the broma files
+ENUMS_FILE = "Enums.hpp"
+
+# Comments right above an enum stay with it, the body is found by `enum_end` so braces in comments can't cut it short
+ENUM_RE = re.compile(
+    r"^(?P<comments>(?:[ \t]*//[^\n]*\n)*)"
+    r"[ \t]*enum\s+(?:(?:class|struct)\s+)?(?P<name>\w+)\s*(?::\s*[\w:\s]+?)?\s*\{",
+    re.M,
+)
+
+# Everything the scan for the closing brace has to step over
+SKIPPED_RE = re.compile(r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|[{}]', re.S)
+
+# The `;` after the body and a comment trailing on the same line, nothing else on that line belongs to the enum
+ENUM_TAIL_RE = re.compile(r"\s*;(?:[ \t]*//[^\n]*)?")
+
+# Fewer than this share of the bundled enums means Enums.hpp changed shape under us
+ENUMS_EXPECTED = 0.5
+
+
+class Enum(NamedTuple):
+    name: str
+    text: str
+    """The whole declaration as it was written including the comments above it"""
+
+
+@lru_cache(maxsize=None)
+def read_data(name: str) -> str:
+    return (DATA / name).read_text(encoding="utf-8")
+
+
+def macros() -> str:
+    return read_data("macros.h")
+
+
+def gd_namespace() -> str:
+    return read_data("gd_namespace.h")
+
+
+def enum_end(text: str, start: int) -> int:
+    """Where the body opened right before `start` is closed, braces in comments
+    and strings don't count. -1 when it never is"""
+    depth = 1
+    for m in SKIPPED_RE.finditer(text, start):
+        if m.group() == "{":
+            depth += 1
+        elif m.group() == "}":
+            depth -= 1
+            if not depth:
+                return m.end()
+    return -1
+
+
+def parse_enums(text: str) -> list[Enum]:
+    """Pulls every enum declaration out of a C++ header, everything in between
+    (includes, macros, operator overloads, the namespace around them) is dropped"""
+    text = text.replace("\r\n", "\n")
+    found = []
+    pos = 0
+    while m := ENUM_RE.search(text, pos):
+        end = enum_end(text, m.end())
+        if end == -1:
+            break
+        pos = end
+        # `enum Foo { ... } foo;` and friends aren't declarations we can use
+        if tail := ENUM_TAIL_RE.match(text, end):
+            found.append(Enum(m["name"], text[m.start():tail.end()].strip("\n")))
+            pos = tail.end()
+    return found
+
+
+def render_enums(enums: list[Enum]) -> str:
+    """Lays enums out the same way as the bundled dump with it's preamble on top"""
+    bundled = read_data("enums.h")
+    preamble = bundled[:ENUM_RE.search(bundled).start()]
+    return preamble + "".join(e.text + "\n\n" for e in enums)
+
+
+@lru_cache(maxsize=8)
+def _generate_enums(path: str, mtime: int) -> str:  # pylint: disable=unused-argument
+    # mtime is only here so that the cache misses whenever the file changes
+    geode = parse_enums(Path(path).read_text(encoding="utf-8"))
+    bundled = len(parse_enums(read_data("enums.h")))
+    if len(geode) < bundled * ENUMS_EXPECTED:
+        print(f"[!] Only {len(geode)} enums were found in {path} where the bundled ones have {bundled}, includes.h might be missing some")
+    names = {e.name for e in geode}
+    # Geode might pick up one of ours some day, theirs wins if it does...
+    extras = [e for e in parse_enums(read_data("enums_extra.h")) if e.name not in names]
+    return render_enums(geode + extras)
+
+
+def enums(path: Union[str, Path, None] = None) -> str:
+    """Enums generated from geode's `Enums.hpp` at `path`, or the bundled ones if it's missing"""
+    if path is not None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+        else:
+            return _generate_enums(str(path), mtime)
+    return read_data("enums.h") + read_data("enums_extra.h")
@@ -0,0 +1,68 @@
+"""Splitting generation up between machines. Every class belongs to exactly one
+of N shards by a stable hash of it's name, a shard writes the headers and
+sources of only it's own classes plus a manifest (`shard.json`) of what it
+wrote, `merge` then copies every shard into the final tree and puts includes.h
+together out of the manifests...
+
+    decomp-deploy -o shard-1 generate --shard 1/3
+    decomp-deploy -o shard-2 generate --shard 2/3
+    decomp-deploy -o shard-3 generate --shard 3/3
+    decomp-deploy merge shard-1 shard-2 shard-3
+"""
+
+import json
+import zlib
+from pathlib import Path
+from typing import Union
+
+# Bump this whenever the manifest changes so that shards made by different versions aren't merged
+MANIFEST_VERSION = 1
+
+SHARD_MANIFEST = "shard.json"
+
+
+def shard_of(name: str, count: int) -> int:
+    """Which of `count` shards a class belongs to, crc32 is used since hash() of
+    a string is different in every process"""
+    return zlib.crc32(name.encode("utf-8")) % count
+
+
+def parse_shard(text: str) -> tuple[int, int]:
+    """`2/4` into (1, 4), shards are numbered from 1 on the commandline but from 0 everywhere else"""
+    index, sep, count = text.partition("/")
+    if not sep or not index.isdigit() or not count.isdigit() or not 1 <= int(index) <= int(count):
+        raise ValueError(f"{text!r} isn't a shard, expected i/N such as 1/4")
+    return int(index) - 1, int(count)
+
+
+def load_manifests(directories: list[Union[str, Path]]) -> list[tuple[Path, dict]]:
+    """Reads the manifest of every shard and makes sure that together they are
+    every shard of the same bindings, each exactly once"""
+    manifests = []
+    for directory in directories:
+        path = Path(directory) / SHARD_MANIFEST
+        if not path.exists():
+            raise ValueError(f"{path} is missing, {directory} isn't the output of `generate --shard`")
+        with open(path, "r", encoding="utf-8") as r:
+            manifest = json.load(r)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"{path} was made by another version of the generator")
+        manifests.append((Path(directory), manifest))
+
+    if not manifests:
+        raise ValueError("No shards were given")
+    first = manifests[0][1]
+    for directory, manifest in manifests:
+        if manifest["shards"] != first["shards"]:
+            raise ValueError(f"{directory} is one of {manifest['shards']} shards but {manifests[0][0]} is one of {first['shards']}")
+        if manifest["bindings"] != first["bindings"]:
+            raise ValueError(f"{directory} and {manifests[0][0]} were generated from different bindings")
+
+    seen: dict[int, Path] = {}
+    for directory, manifest in manifests:
+        if (other := seen.get(manifest["shard"])) is not None:
+            raise ValueError(f"{directory} and {other} are both shard {manifest['shard']}/{manifest['shards']}")
+        seen[manifest["shard"]] = directory
+    if missing := [f"{i}/{first['shards']}" for i in range(1, first["shards"] + 1) if i not in seen]:
+        raise ValueError(f"Shards {', '.join(missing)} are missing")
+    return sorted(manifests, key=lambda m: m[1]["shard"])
@@ -0,0 +1,197 @@
+"""A local stand-in for github so that the `Client` can be tested and measured
+without the network. It serves synthetic bindings and a cocos zip and can be
+made slow, throttled or flaky on purpose...
+
+    python -m decomp_deployer.standin --port 8080 --latency 0.05 --bandwidth 1000000
+"""
+
+import asyncio
+import hashlib
+import random
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+from yarl import URL
+
+from .resources import DATA, SNAPSHOT
+
+
+COCOS2D_PATH = "cocos-headers/archive/refs/heads/master.zip"
+
+ENUMS_PATH = "bindings/include/Geode/Enums.hpp"
+
+# The same enums that get bundled with the writer
+ENUMS = DATA / "enums.h"
+
+
+def synthetic_bindings(version: str, size: int = 0, snapshot: Path = SNAPSHOT) -> dict[str, bytes]:
+    """Bindings files laid out the same way as the geode repo. The snapshot is
+    repeated until every file is at least `size` bytes so that the transfer
+    itself can be measured..."""
+    files = {}
+    for name in ("Cocos2d.bro", "GeometryDash.bro", "Extras.bro"):
+        data = (snapshot / name).read_bytes()
+        if size and data:
+            data = data * (size // len(data) + 1)
+        files[f"bindings/{version}/{name}"] = data
+    return files
+
+
+def synthetic_cocos_zip() -> bytes:
+    """A tiny version of the cocos-headers repo archive"""
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("cocos-headers-master/cocos2d/cocos2d.h", "#pragma once\n")
+        z.writestr("cocos-headers-master/fmod/fmod.h", "#pragma once\n")
+        z.writestr("cocos-headers-master/fmt/include/fmt/format.h", "#pragma once\n")
+    return buf.getvalue()
+
+
+class StandInServer:
+    """Serves `files` (url path -> contents) over http on localhost
+
+    - latency: seconds to wait before answering every request
+    - bandwidth: bytes per second the body is throttled to (None for unlimited)
+    - error_rate: chance of answering with a 503 instead
+    - every file gets an ETag and `If-None-Match` is answered with a 304
+    - writable: files can be uploaded with a PUT, enough to serve an artifact cache
+    """
+
+    def __init__(
+        self,
+        files: Optional[dict[str, bytes]] = None,
+        latency: float = 0.0,
+        bandwidth: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        writable: bool = False,
+    ) -> None:
+        self.files: dict[str, bytes] = {}
+        self.etags: dict[str, str] = {}
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.host = host
+        self.port = port
+        self.writable = writable
+        self.requests = 0
+        self.statuses: dict[int, int] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+        for path, data in (files or {}).items():
+            self.add_file(path, data)
+
+    def add_file(self, path: str, data: bytes):
+        path = path.lstrip("/")
+        self.files[path] = data
+        self.etags[path] = '"' + hashlib.sha1(data).hexdigest() + '"'
+
+    @property
+    def url(self) -> URL:
+        return URL.build(scheme="http", host=self.host, port=self.port)
+
+    def _count(self, status: int):
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            self._count(503)
+            return web.Response(status=503, text="Injected failure")
+
+        path = request.match_info["path"]
+        data = self.files.get(path)
+        if data is None:
+            self._count(404)
+            return web.Response(status=404)
+
+        etag = self.etags[path]
+        if request.headers.get("If-None-Match") == etag:
+            self._count(304)
+            return web.Response(status=304, headers={"ETag": etag})
+
+        self._count(200)
+        if not self.bandwidth:
+            return web.Response(body=data, headers={"ETag": etag})
+
+        resp = web.StreamResponse(headers={"ETag": etag})
+        resp.content_length = len(data)
+        await resp.prepare(request)
+        # Send it in slices of roughly 1/20th of a second worth of bandwidth
+        chunk = max(1, self.bandwidth // 20)
+        for i in range(0, len(data), chunk):
+            await resp.write(data[i:i + chunk])
+            await asyncio.sleep(len(data[i:i + chunk]) / self.bandwidth)
+        await resp.write_eof()
+        return resp
+
+    async def handle_put(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.add_file(request.match_info["path"], await request.read())
+        self._count(201)
+        return web.Response(status=201)
+
+    async def start(self) -> URL:
+        # Cached trees are a lot bigger than aiohttp's default limit of 1MB
+        app = web.Application(client_max_size=1024 ** 3 if self.writable else 1024 ** 2)
+        app.router.add_get("/{path:.*}", self.handle)
+        if self.writable:
+            app.router.add_put("/{path:.*}", self.handle_put)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            # Find out what port the os gave us
+            self.port = self._runner.addresses[0][1]
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+
+async def serve(version: str = "2.2074", **kwargs):
+    """Runs the stand-in forever with synthetic bindings and cocos2d"""
+    files = synthetic_bindings(version)
+    files[COCOS2D_PATH] = synthetic_cocos_zip()
+    files[ENUMS_PATH] = ENUMS.read_bytes()
+    async with StandInServer(files, **kwargs) as server:
+        print(f"[+] Serving bindings at {server.url / 'bindings'}")
+        print(f"[+] Serving cocos2d at {server.url / COCOS2D_PATH}")
+        if server.writable:
+            print(f"[+] Accepting uploads, use {server.url / 'cache'} as an artifact cache")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    import asyncclick as click
+
+    @click.command()
+    @click.option("--version", "-v", default="2.2074")
+    @click.option("--port", "-p", default=8080)
+    @click.option("--latency", default=0.0, help="Seconds to wait before answering any request")
+    @click.option("--bandwidth", default=None, type=int, help="Throttles every response to this many bytes per second")
+    @click.option("--error-rate", default=0.0, help="Chance of answering a request with a 503")
+    @click.option("--writable", is_flag=True, help="Accepts uploads with PUT so that it can be used as an artifact cache")
+    async def cli(version: str, port: int, latency: float, bandwidth: int, error_rate: float, writable: bool):
+        await serve(version, port=port, latency=latency, bandwidth=bandwidth, error_rate=error_rate, writable=writable)
+
+    cli()
@@ -0,0 +1,236 @@
+"""A sqlite index of every class, member, pad, function and binding address that
+the writer walks over, so that questions like "which classes take a GJGameLevel*"
+or "what's at 0x2ea000 on windows" don't need a grep through the whole tree..."""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Union
+
+from .model import Class, FunctionBindField, MemberField, PadField
+from .output import partial_path
+
+SCHEMA = """
+CREATE TABLE classes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE TABLE superclasses (
+    class_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE members (
+    class_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL
+);
+CREATE TABLE pads (
+    class_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    amount INTEGER NOT NULL
+);
+CREATE TABLE functions (
+    id INTEGER PRIMARY KEY,
+    class_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    ret TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    is_static INTEGER NOT NULL,
+    is_virtual INTEGER NOT NULL,
+    is_const INTEGER NOT NULL
+);
+CREATE TABLE arguments (
+    function_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL
+);
+CREATE TABLE addresses (
+    function_id INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    address INTEGER NOT NULL
+);
+"""
+
+# Indexes are made after everything is inserted, it's a lot faster that way...
+INDEXES = """
+CREATE UNIQUE INDEX classes_name ON classes (name);
+CREATE INDEX superclasses_class ON superclasses (class_id);
+CREATE INDEX superclasses_name ON superclasses (name);
+CREATE INDEX members_class ON members (class_id);
+CREATE INDEX members_name ON members (name);
+CREATE INDEX members_type ON members (type);
+CREATE INDEX pads_class ON pads (class_id);
+CREATE INDEX functions_class ON functions (class_id);
+CREATE INDEX functions_name ON functions (name);
+CREATE INDEX functions_ret ON functions (ret);
+CREATE INDEX arguments_function ON arguments (function_id);
+CREATE INDEX arguments_type ON arguments (type);
+CREATE INDEX addresses_lookup ON addresses (platform, address);
+CREATE INDEX addresses_function ON addresses (function_id);
+"""
+
+
+class SymbolIndex:
+    """Collects rows while the writer walks the bindings and writes them all
+    out in one transaction when closed"""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.classes = []
+        self.superclasses = []
+        self.members = []
+        self.pads = []
+        self.functions = []
+        self.arguments = []
+        self.addresses = []
+
+    def add_class(self, node: Class, kind: str):
+        class_id = len(self.classes) + 1
+        self.classes.append((class_id, node.name, kind))
+        for i, s in enumerate(node.superclasses):
+            self.superclasses.append((class_id, i, s))
+
+        for position, field in enumerate(node.fields):
+            t = type(field)
+            if t is FunctionBindField:
+                self.add_function(class_id, position, node.name, field)
+            elif t is MemberField:
+                self.members.append((class_id, position, field.name, field.type.name))
+            elif t is PadField:
+                for platform, amount in field.amount:
+                    self.pads.append((class_id, position, platform, amount))
+
+    def add_function(self, class_id: int, position: int, class_name: str, node: FunctionBindField):
+        proto = node.prototype
+        function_id = len(self.functions) + 1
+        args = proto.args
+        signature = f"{proto.ret.name} {class_name}::{proto.name}(" + ", ".join(f"{t.name} {a}" for a, t in args) + ")"
+        if proto.is_const:
+            signature += " const"
+        self.functions.append(
+            (function_id, class_id, position, proto.name, proto.ret.name, signature, proto.is_static, proto.is_virtual, proto.is_const)
+        )
+        for i, (name, _type) in enumerate(args):
+            self.arguments.append((function_id, i, name, _type.name))
+        for platform, address in node.binds:
+            self.addresses.append((function_id, platform, address))
+
+    def close(self):
+        # Always start from scratch, an index of an older version is worse than none.
+        # It's built under another name and renamed so nobody sees half of it...
+        partial = partial_path(self.path)
+        db = sqlite3.connect(partial)
+        try:
+            db.executescript(SCHEMA)
+            with db:
+                db.executemany("INSERT INTO classes VALUES (?, ?, ?)", self.classes)
+                db.executemany("INSERT INTO superclasses VALUES (?, ?, ?)", self.superclasses)
+                db.executemany("INSERT INTO members VALUES (?, ?, ?, ?)", self.members)
+                db.executemany("INSERT INTO pads VALUES (?, ?, ?, ?)", self.pads)
+                db.executemany("INSERT INTO functions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.functions)
+                db.executemany("INSERT INTO arguments VALUES (?, ?, ?, ?)", self.arguments)
+                db.executemany("INSERT INTO addresses VALUES (?, ?, ?)", self.addresses)
+            db.executescript(INDEXES)
+            db.close()
+            os.replace(partial, self.path)
+        except BaseException:
+            db.close()
+            partial.unlink(missing_ok=True)
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class SymbolQuery:
+    """Read side of the index used by the `symbols` command"""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        if not Path(path).exists():
+            raise FileNotFoundError(f"{path} is missing, the decomp environment needs to be built first")
+        self.db = sqlite3.connect(f"file:{Path(path).as_posix()}?mode=ro", uri=True)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def class_info(self, name: str) -> list[str]:
+        """Superclasses, members and functions of a class in the order they were declared"""
+        row = self.db.execute("SELECT id, kind FROM classes WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return []
+        class_id, kind = row
+        lines = [f"{name} ({kind})"]
+        lines += [f"    : {s}" for (s,) in self.db.execute(
+            "SELECT name FROM superclasses WHERE class_id = ? ORDER BY position", (class_id,)
+        )]
+        fields = self.db.execute(
+            """
+            SELECT position, type || ' ' || name FROM members WHERE class_id = :id
+            UNION ALL
+            SELECT position, 'PAD = ' || group_concat(platform || ' ' || printf('0x%x', amount), ', ') FROM pads WHERE class_id = :id GROUP BY position
+            UNION ALL
+            SELECT position, signature FROM functions WHERE class_id = :id
+            ORDER BY 1
+            """,
+            {"id": class_id},
+        )
+        lines += [f"    {text};" for _, text in fields]
+        return lines
+
+    def functions_taking(self, type: str) -> list[str]:
+        return [s for (s,) in self.db.execute(
+            """
+            SELECT DISTINCT f.signature FROM arguments a JOIN functions f ON f.id = a.function_id
+            WHERE a.type = ? ORDER BY f.signature
+            """,
+            (type,),
+        )]
+
+    def functions_returning(self, type: str) -> list[str]:
+        return [s for (s,) in self.db.execute(
+            "SELECT signature FROM functions WHERE ret = ? ORDER BY signature", (type,)
+        )]
+
+    def members_of_type(self, type: str) -> list[str]:
+        return [f"{c}::{m}" for c, m in self.db.execute(
+            """
+            SELECT c.name, m.name FROM members m JOIN classes c ON c.id = m.class_id
+            WHERE m.type = ? ORDER BY c.name, m.position
+            """,
+            (type,),
+        )]
+
+    def subclasses(self, name: str) -> list[str]:
+        return [c for (c,) in self.db.execute(
+            """
+            SELECT c.name FROM superclasses s JOIN classes c ON c.id = s.class_id
+            WHERE s.name = ? ORDER BY c.name
+            """,
+            (name,),
+        )]
+
+    def address(self, address: int, platform: str = None) -> list[str]:
+        query = """
+            SELECT a.platform, f.signature FROM addresses a JOIN functions f ON f.id = a.function_id
+            WHERE a.address = ?
+        """
+        params = [address]
+        if platform:
+            query += " AND a.platform = ?"
+            params.append(platform)
+        return [f"{p} {s}" for p, s in self.db.execute(query + " ORDER BY a.platform", params)]
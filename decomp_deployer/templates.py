@@ -0,0 +1,182 @@
+"""Templates for all of the C++ text that the writer puts out. Every template is
+compiled once into a plain python function made of string concatenations so
+rendering thousands of classes costs about the same as writing the strings
+out by hand did, while teams can still swap any of them out with their own
+`<name>.tmpl` file through `--templates <directory>` without forking the tool...
+
+Templates use `str.format` syntax (`{name}` fields, `{{` and `}}` for braces)
+but only plain field names are allowed, python keywords and names starting
+with `_` can't be fields. Whole files (`header`, `source`,
+`includes` and `addresses`) are written without their final newline.
+"""
+
+from functools import lru_cache
+from keyword import iskeyword
+from pathlib import Path
+from string import Formatter
+from typing import Callable, Union
+
+
+DEFAULTS = {
+    # -- Headers --
+    "header": (
+        "#ifndef __{guard}_H__\n"
+        "#define __{guard}_H__\n"
+        "\n"
+        "\n"
+        '#include "{include}"\n'
+        "\n"
+        "{predefines}"
+        "class {name}{bases} {{\n"
+        "public:\n"
+        "{body}"
+        "}};\n"
+        "\n"
+        "#endif /* __{guard}_H__ */\n"
+    ),
+    "predefines": "\n/* -- Predefined Subclasses -- */\n\n{classes}\n",
+    "predefine": "class {name};\n",
+    "bases": ": {bases}",
+    "base": "public {name}",
+    "member": "    {type} {name};\n",
+    "pad": "    /* PAD */\n\n",
+    "declaration": "    {qualifiers}{ret} {name}({args});\n",
+    "argument": "{type} {name}",
+    # -- Sources --
+    "source": '\n#include "includes.h"\n\n\n{functions}',
+    "definition": "{ret} {cls}::{name}({args})\n{{\n    return;\n}}\n\n\n",
+    "unknown_definition": "\n/* Unknown Return: {cls}::{name}({args}){{}}; */\n\n",
+    "source_argument": "{struct}{type} {name}",
+    # -- includes.h --
+    "includes": (
+        "#ifndef __INCLUDES_H__\n"
+        "#define __INCLUDES_H__\n"
+        "\n"
+        "\n"
+        "/* External Resources */\n"
+        "#ifdef _WIN32\n"
+        "    #define WIN32_LEAN_AND_MEAN\n"
+        "    #include <windows.h>\n"
+        "#endif /* _WIN32 */\n"
+        "#include <cocos2d.h>\n"
+        "#include <fmt/format.h>\n"
+        "#include <fmod/fmod.h>\n"
+        "#include <cstdlib>\n"
+        "#include <cstring>\n"
+        "#include <string>\n"
+        "#include <map>\n"
+        "#include <unordered_map>\n"
+        "#include <unordered_set>\n"
+        "#include <array>\n"
+        "\n"
+        "/* Macros */\n"
+        "#ifndef TodoReturn\n"
+        "    #define TodoReturn void*\n"
+        "#endif /* TodoReturn */\n"
+        "{macros}\n"
+        "{gd_namespace}\n"
+        "{groups}"
+        "/* Delegates */\n"
+        "{delegates}"
+        "{enums}\n"
+        "#endif /* __INCLUDES_H__ */\n"
+    ),
+    "include_group": "/* {name} */\n\n{includes}\n\n",
+    "include": '#include "{path}"\n',
+    "delegate": "{predefines}class {name}{bases} {{\npublic:\n{body}}};\n\n\n",
+    # -- addresses.h --
+    "addresses": (
+        "#ifndef __ADDRESSES_H__\n"
+        "#define __ADDRESSES_H__\n"
+        "\n"
+        "#include <cstdint>\n"
+        "\n"
+        "/* Every bound function sorted by address for each platform, use std::upper_bound to find what an address belongs to */\n"
+        "struct AddressEntry {{\n"
+        "    std::uintptr_t address;\n"
+        "    const char* symbol;\n"
+        "}};\n"
+        "\n"
+        "namespace addresses {{\n"
+        "\n"
+        "{tables}"
+        "}} /* namespace addresses */\n"
+        "\n"
+        "#endif /* __ADDRESSES_H__ */\n"
+    ),
+    "address_table": "inline constexpr AddressEntry {platform}[] = {{\n{entries}}};\n\n",
+    "address": '    {{ {address}, "{symbol}" }},\n',
+}
+
+
+class TemplateError(ValueError):
+    """A template that can't be used, `name` is the template (and the `<name>.tmpl`) it's about"""
+
+    def __init__(self, name: str, message: str) -> None:
+        super().__init__(message)
+        self.name = name
+
+
+@lru_cache(maxsize=None)
+def compile_template(text: str) -> tuple[Callable[..., str], tuple[str, ...]]:
+    """Turns a template into a function taking it's fields as keyword arguments.
+    Fields that a template doesn't use are ignored so that custom templates can
+    leave things out"""
+    parts = []
+    fields = []
+    for literal, field, spec, conversion in Formatter().parse(text):
+        if literal:
+            parts.append(repr(literal))
+        if field is not None:
+            if not field.isidentifier() or spec or conversion:
+                raise ValueError(f"Only plain fields are allowed in templates, not {{{field}}}")
+            # They become the parameters of the function below, `**_` is the last one
+            if iskeyword(field) or field.startswith("_"):
+                raise ValueError(f"{{{field}}} can't be a field, it's a python keyword or starts with _")
+            parts.append(field)
+            fields.append(field)
+
+    fields = tuple(dict.fromkeys(fields))
+    params = "".join(f"{f}, " for f in fields)
+    body = " + ".join(parts) if parts else "''"
+    # Everything is a string already, so a single concatenation is as fast as it gets...
+    render = eval(f"lambda {'*, ' if fields else ''}{params}**_: {body}", {"__builtins__": {}})  # pylint: disable=eval-used
+    return render, fields
+
+
+class Templates:
+    """All templates used by the writer, every template is an attribute so
+    `templates.member(type="int", name="m_x")` renders one"""
+
+    def __init__(self, overrides: dict[str, str] = None) -> None:
+        self.texts = dict(DEFAULTS)
+        for name, text in (overrides or {}).items():
+            if name not in DEFAULTS:
+                raise TemplateError(name, f"Unknown template {name!r}")
+            self.texts[name] = text
+
+        for name, text in self.texts.items():
+            try:
+                render, fields = compile_template(text)
+            except ValueError as e:
+                raise TemplateError(name, f"Template {name!r}: {e}") from e
+            # Custom templates can use less fields than the defaults but never more
+            if unknown := set(fields) - set(compile_template(DEFAULTS[name])[1]):
+                raise TemplateError(name, f"Template {name!r} uses unknown fields: {', '.join(sorted(unknown))}")
+            setattr(self, name, render)
+
+    @classmethod
+    def from_directory(cls, path: Union[str, Path]) -> "Templates":
+        """Loads every `<name>.tmpl` in a directory on top of the defaults"""
+        overrides = {}
+        for f in Path(path).glob("*.tmpl"):
+            overrides[f.stem] = f.read_text(encoding="utf-8")
+        return cls(overrides)
+
+
+DEFAULT_TEMPLATES = Templates()
+
+
+def finish(text: str) -> str:
+    """Files are written without their last newline, the same way they always were"""
+    return text[:-1] if text.endswith("\n") else text
@@ -0,0 +1,126 @@
+"""Keeps the decomp tree up to date while someone is editing the broma files by hand.
+Only the classes that actually changed get their header and source rewritten and
+includes.h is only touched when the set of classes (or a delegate) changes..."""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import AsyncIterator, Union
+
+from .model import BINDINGS_FILES, CONCAT_CACHE, Class, parse_bindings
+from .output import DirectoryOutput, MemoryOutput, Output
+from .resources import ENUMS_FILE
+from .writer import ClassHeadersWriter, concat_bindings
+
+
+def snapshot(files: list[Path]) -> dict[Path, tuple]:
+    snap = {}
+    for f in files:
+        try:
+            st = os.stat(f)
+            snap[f] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            snap[f] = None
+    return snap
+
+
+async def poll_changes(files: list[Path], interval: float = 0.1) -> AsyncIterator[None]:
+    """Checks the modification times of the files every `interval` seconds"""
+    last = snapshot(files)
+    while True:
+        await asyncio.sleep(interval)
+        current = snapshot(files)
+        if current != last:
+            last = current
+            yield
+
+
+async def changes(files: list[Path], interval: float = 0.1) -> AsyncIterator[None]:
+    """Yields every time one of the files changes. watchfiles (inotify and friends)
+    is used when it's installed otherwise we fall back to polling..."""
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        async for _ in poll_changes(files, interval):
+            yield
+        return
+
+    names = {f.resolve() for f in files}
+    dirs = {str(f.parent) for f in files}
+    # the default debounce of watchfiles is well over a second...
+    async for batch in awatch(*dirs, debounce=50, step=int(interval * 1000)):
+        if any(Path(p).resolve() in names for _, p in batch):
+            yield
+
+
+class Watcher:
+    """Remembers the model of every class from the last parse so that a change
+    only regenerates what's different, the model is made of plain tuples so
+    comparing two classes is enough to know if anything in them changed"""
+
+    def __init__(self, bindings: Union[str, Path] = ".temp", output: Output = None, cache: Union[str, Path] = CONCAT_CACHE, parser: str = None) -> None:
+        self.bindings = Path(bindings)
+        self.output = output if output is not None else DirectoryOutput()
+        self.cache = cache
+        self.parser = parser
+        self.previous: dict[str, Class] = {}
+
+    @property
+    def files(self) -> list[Path]:
+        return [self.bindings / name for name in BINDINGS_FILES]
+
+    def parse(self) -> list[Class]:
+        concat_bindings(self.bindings, self.cache)
+        return parse_bindings(self.cache, self.parser)
+
+    def prime(self):
+        """Takes the model of the current bindings without writing anything,
+        the tree is expected to already be up to date with them"""
+        self.previous = {c.name: c for c in self.parse()}
+
+    def update(self) -> tuple[list[str], list[str], bool]:
+        """Re-parses and rewrites what changed. Returns the classes that were
+        rewritten, the classes that were removed and if includes.h was rewritten"""
+        classes = self.parse()
+        current = {c.name: c for c in classes}
+        changed = {name for name, c in current.items() if self.previous.get(name) != c}
+        removed = sorted(self.previous.keys() - current.keys())
+
+        chw = ClassHeadersWriter(self.output, changed)
+        if changed:
+            chw.start(classes)
+            chw.write_sources()
+
+        # includes.h lists every class and carries the delegates so any of those changing means a rewrite...
+        includes = current.keys() != self.previous.keys() or bool(chw.delegates)
+        if includes:
+            full = ClassHeadersWriter(MemoryOutput())
+            full.start(classes)
+            full.output = self.output
+            full.write_includes(self.bindings / ENUMS_FILE)
+
+        # The output stays open for as long as we watch, new files go into the manifest right away
+        self.output.flush()
+        self.previous = current
+        return [s.cppCls.name for s in chw.classes], removed, includes
+
+    async def run(self, interval: float = 0.1):
+        self.prime()
+        print(f"[...] Watching {', '.join(str(f) for f in self.files)}")
+        async for _ in changes(self.files, interval):
+            start = time.perf_counter()
+            try:
+                # Parsing and writing block, the loop has to keep watching meanwhile
+                written, removed, includes = await asyncio.to_thread(self.update)
+            except Exception as e:  # pylint: disable=broad-except
+                # A half saved file shouldn't kill the watcher...
+                print(f"[!] Failed to regenerate: {e}")
+                continue
+            for name in written:
+                print(f"[+] {name}")
+            for name in removed:
+                print(f"[!] {name} was removed, it's old files were left alone")
+            if includes:
+                print("[+] includes.h")
+            print(f"[+] Updated in {(time.perf_counter() - start) * 1000:.0f}ms")
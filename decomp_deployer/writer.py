@@ -0,0 +1,513 @@
+import json
+import hashlib
+from enum import IntEnum
+from pathlib import Path
+from typing import NamedTuple, Union
+
+from .addresses import AddressIndex
+from .compile_db import angle_includes, write_editor_configs
+from .model import (BINDINGS_FILES, CONCAT_CACHE, MODEL_CACHE, Class,
+                    FunctionBindField, FunctionProto, MemberField, ModelVisitor,
+                    PadField, load_model, parse_bindings, save_model)
+from .output import DirectoryOutput, Output, atomic_write, open_output
+from .profiling import Profiler
+from .resources import ENUMS_FILE, enums, gd_namespace, macros
+from .shards import MANIFEST_VERSION, SHARD_MANIFEST, load_manifests, shard_of
+from .symbols import SymbolIndex
+from .templates import DEFAULT_TEMPLATES, Templates, finish
+
+# TODO Supply with enums...
+
+
+class ClassType(IntEnum):
+    """Used to determine the possible path of where a file is going to be written to"""
+
+    Default = 0
+    Manager = 1
+    Delegate = 2
+    CustomCC = 3
+    """a CC class without the cocos2d namespace"""
+    Cocos2d = 4
+    """a libcocos class object"""
+    Layer = 5
+    Cell = 6
+    ToolBox = 7
+
+
+# Where every kind of class goes under `headers/` and `src/`, categories can be
+# nested ("UI/Layers") by handing the writer a different mapping
+CATEGORIES = {
+    ClassType.Manager: "Managers",
+    ClassType.Cell: "Cells",
+    ClassType.ToolBox: "Tools",
+    ClassType.CustomCC: "CustomCCClasses",
+    ClassType.Layer: "Layers",
+    # Put defaults into the common directory as opposed
+    # to the place where includes.h will be located for
+    # tidiness...
+    ClassType.Default: "Common",
+}
+
+
+def classify(name: str) -> ClassType:
+    """determines if a class is a delegate, a robtop CC class (Custom Libcocos class) or a CellType..."""
+    if name.startswith("cocos2d::") or name.startswith("DS_Dictionary"):
+        # This one is an ignore flag we will be installing cocos-headers to make up for that...
+        return ClassType.Cocos2d
+    elif "delegate" in name.lower():
+        return ClassType.Delegate
+    elif name.startswith("CC"):
+        return ClassType.CustomCC
+    elif name.startswith(("TableView", "BoomListView")) or name.lower().endswith(
+        "cell"
+    ):
+        return ClassType.Cell
+    elif name.lower().endswith("manager"):
+        return ClassType.Manager
+    elif name.lower().endswith("layer"):
+        return ClassType.Layer
+    # A ToolBox is simillar to a delegate but it's treated more as special namespace...
+    elif name == "LevelTools" or name.lower().endswith("toolbox"):
+        return ClassType.ToolBox
+    else:
+        return ClassType.Default
+
+
+def translateTypeName(tname: str):
+    return tname.replace("gd::", "std::")
+
+
+def write_predefines(templates: Templates, superclasses: list[str]):
+    """Predefines the superclasses of a class. This is mainly imeplemnted for intellisense safety..."""
+    superclasses = [s for s in superclasses if not s.startswith("cocos2d::")]
+    if not superclasses:
+        return ""
+    return templates.predefines(classes="".join([templates.predefine(name=s) for s in superclasses]))
+
+
+def write_bases(templates: Templates, superclasses: list[str]):
+    if not superclasses:
+        return ""
+    return templates.bases(bases=", ".join([templates.base(name=s) for s in superclasses]))
+
+
+def write_declaration(templates: Templates, proto: FunctionProto):
+    if proto.is_virtual:
+        qualifiers = "virtual "
+    elif proto.is_static:
+        qualifiers = "static "
+    else:
+        qualifiers = ""
+    if proto.is_const:
+        qualifiers += "const "
+    return templates.declaration(
+        qualifiers=qualifiers,
+        ret=proto.ret.name,
+        name=proto.name,
+        args=", ".join([templates.argument(type=translateTypeName(t.name), name=a) for a, t in proto.args]),
+    )
+
+
+class SourceFile(NamedTuple):
+    srcName: str
+    path: str
+    cppCls: Class
+    type:ClassType
+
+    def translateTypeName(self, tname: str):
+        return translateTypeName(tname)
+
+    def write_function(self, templates: Templates, f: FunctionProto):
+        # start by writing the signature and then write the function if there's no TodoReturn
+        args = ", ".join(
+            [
+                templates.source_argument(
+                    struct="struct " if t.is_struct else "", type=translateTypeName(t.name), name=a
+                )
+                for a, t in f.args
+            ]
+        )
+
+        if f.ret.name == "TodoReturn":
+            # comment out instead
+            return templates.unknown_definition(cls=self.cppCls.name, name=f.name, args=args)
+
+        # This should be the most appropreate way to deal with this for now...
+        return templates.definition(ret=translateTypeName(f.ret.name), cls=self.cppCls.name, name=f.name, args=args)
+
+    def getFunctionsSorted(self):
+        return sorted(self.cppCls.functions, key=lambda f: f.name)
+
+    def write_contents(self, templates: Templates = DEFAULT_TEMPLATES):
+        return finish(templates.source(functions="".join([self.write_function(templates, f) for f in self.getFunctionsSorted()])))
+
+    def write_delegate(self, templates: Templates = DEFAULT_TEMPLATES):
+        return templates.delegate(
+            predefines=write_predefines(templates, self.cppCls.superclasses),
+            name=self.cppCls.name,
+            bases=write_bases(templates, self.cppCls.superclasses),
+            body="".join([write_declaration(templates, proto) for proto in self.getFunctionsSorted()]),
+        )
+
+    def write(self, output: Output, templates: Templates = DEFAULT_TEMPLATES):
+        """Writes the C++ contents"""
+        output.write("src/" + self.path + "/" + self.srcName, self.write_contents(templates))
+
+
+class ClassHeadersWriter(ModelVisitor):
+    """Used for writing Geometry Dash Class Items..."""
+
+    def __init__(self, output: Output = None, only: set[str] = None, index: SymbolIndex = None, templates: Templates = None, categories: dict[ClassType, str] = None, addresses: AddressIndex = None) -> None:
+        self.output = output if output is not None else DirectoryOutput()
+        # When given, every class not in here is skipped...
+        self.only = only
+        self.index = index
+        self.addresses = addresses
+        self.templates = templates if templates is not None else DEFAULT_TEMPLATES
+        self.categories = {**CATEGORIES, **(categories or {})}
+        # Rendered members and functions of the class being visited
+        self.current_body: list[str] = None
+        self.current_class = ""
+        self.includes: list[str] = []
+        self.classes: list[SourceFile] = []
+        self.delegates: list[Class] = []
+        self.pathsdict:dict[str , list[str]] = {}
+
+        super().__init__()
+
+    def determinePath(self, node: Class):
+        """determines if the class object we're about to use is a delegate,
+        a robtop CC class (Custom Libcocos class) or a CellType..."""
+        t = classify(node.name)
+        if t == ClassType.Delegate:
+            # Make an effort to Hold onto all delegates for later use...
+            self.delegates.append(node)
+        return t
+
+    def typeForDirectory(self, t: ClassType):
+        # -- Ignore cocos2d things and delegates! --
+        if t == ClassType.Cocos2d or t == ClassType.Delegate:
+            return None
+
+        path = self.categories[t]
+        if not self.pathsdict.get(path):
+            self.pathsdict[path] = []
+
+        return "headers/" + path
+
+    def plan(self, classes: list[Class]) -> set[str]:
+        """Every directory that walking `classes` is going to write into"""
+        directories = {"headers"}
+        for c in classes:
+            if self.only is not None and c.name not in self.only:
+                continue
+            t = classify(c.name)
+            if t != ClassType.Cocos2d and t != ClassType.Delegate and "pugi::" not in c.name:
+                directories.add("headers/" + self.categories[t])
+                directories.add("src/" + self.categories[t])
+        return directories
+
+    def start(self, classes: list[Class]):
+        # Make every directory up front instead of checking for it with every file...
+        self.output.plan(self.plan(classes))
+        super().start(classes)
+
+    def visit_PadField(self, node: PadField):
+        self.current_body.append(self.templates.pad())
+        return super().visit_PadField(node)
+    
+    def write_memberField(self, name:str, type:str):
+        self.current_body.append(self.templates.member(type=self.fixTypename(type), name=name))
+
+    def visit_MemberField(self, node: MemberField):
+        
+        # TODO: write the functions for SeedValues to the c++ files?
+
+        # NOTE: We need to split up geode's RSVs since were doing A Decomp of What Robtop Has (Not Geode)
+        if node.type.name.startswith("geode::SeedValue"):
+            # Depack into 3 member fields insead of One...
+            name = node.name
+            typename = node.type.name.rstrip("geode::SeedValue")
+            for letter in list(typename):
+                if letter == "R":
+                    self.write_memberField(name + "Rand", "int")
+                elif letter == "S":
+                    self.write_memberField(name + "Seed", "int")
+                elif letter == "V":
+                    self.write_memberField(name, "int")
+            
+        else:
+            self.write_memberField(node.name, node.type.name)
+        return super().visit_MemberField(node)
+
+    def visit_Class(self, node: Class):
+        if self.only is not None and node.name not in self.only:
+            return
+        self.current_class = node
+        # visit the class in question or else otherwise simply ignore it...
+        t = self.determinePath(node)
+        if self.index is not None:
+            self.index.add_class(node, t.name)
+        if self.addresses is not None:
+            self.addresses.add_class(node)
+        if path := self.typeForDirectory(t):
+            headerFilename = node.name + ".h"
+            # pugi isn't ours to write...
+            if "pugi::" in headerFilename:
+                return
+
+            self.current_body = []
+            # write down our the code for it to function
+            super().visit_Class(node)
+            header = self.templates.header(
+                guard=node.name.upper(),
+                include="../" * (path.count("/")) + "includes.h",
+                predefines=write_predefines(self.templates, node.superclasses),
+                name=node.name,
+                bases=write_bases(self.templates, node.superclasses),
+                body="".join(self.current_body),
+            )
+            self.current_body = None
+
+            self.output.write(path + "/" + headerFilename, finish(header))
+            destination = self.categories[t]
+            self.includes.append(destination + "/" + headerFilename)
+            self.pathsdict[destination].append(destination + "/" + headerFilename)
+            self.classes.append(SourceFile(node.name + ".cpp", destination, node, t))
+
+    def fixTypename(self, type: str):
+        return translateTypeName(type)
+
+    def visit_FunctionBindField(self, node: FunctionBindField):
+        # TODO: Maybe add Docs?...
+        self.current_body.append(write_declaration(self.templates, node.prototype))
+
+    def write_sources(self):
+        for files in self.classes:
+            files.write(self.output, self.templates)
+
+    def write_includes(self, enums_path: Union[str, Path] = None):
+        """`enums_path` is geode's Enums.hpp, the bundled enums are used when it's missing"""
+        # TODO: Seperate Delegates into another file in a future version of this tool
+        delegates = "".join(
+            [SourceFile("", "", d, ClassType.Delegate).write_delegate(self.templates) for d in self.delegates]
+        )
+        # The cherry on top is this...
+        self.output.write("headers/includes.h", render_includes(self.templates, self.pathsdict, delegates, enums(enums_path)))
+
+    def shard_manifest(self, classes: list[Class], shard: tuple[int, int], bindings: bytes, enums_path: Union[str, Path] = None) -> dict:
+        """Everything `merge_shards` needs to know about the classes this shard wrote.
+        `order` is where a class is in the whole model so that includes.h lists
+        everything in the same order no matter which shard it came from"""
+        order = {c.name: i for i, c in enumerate(classes)}
+        return {
+            "version": MANIFEST_VERSION,
+            "shard": shard[0] + 1,
+            "shards": shard[1],
+            "bindings": hashlib.sha256(bindings).hexdigest(),
+            "groups": sorted(self.pathsdict),
+            "classes": [
+                {
+                    "name": s.cppCls.name,
+                    "order": order[s.cppCls.name],
+                    "group": s.path,
+                    "include": s.path + "/" + s.cppCls.name + ".h",
+                    "files": ["headers/" + s.path + "/" + s.cppCls.name + ".h", "src/" + s.path + "/" + s.srcName],
+                }
+                for s in self.classes
+            ],
+            "delegates": [
+                {"name": d.name, "order": order[d.name], "text": SourceFile("", "", d, ClassType.Delegate).write_delegate(self.templates)}
+                for d in self.delegates
+            ],
+            "enums": enums(enums_path),
+        }
+    
+    def write_addresses(self):
+        """headers/addresses.h, the same sorted tables that `lookup` searches through"""
+        templates = self.templates
+        tables = "".join(
+            templates.address_table(
+                platform=platform,
+                entries="".join(templates.address(address=hex(a), symbol=s) for a, s in table),
+            )
+            for platform, table in self.addresses.tables().items()
+        )
+        self.output.write("headers/addresses.h", finish(templates.addresses(tables=tables)))
+
+    def write_vscode_header(self, root: Union[str, Path] = "."):
+        """As an extra blessing to the user I will setup the configurations for intellisense
+        (and clangd) for you on every platform, `root` is where the tree ends up"""
+        sources = ["src/" + s.path + "/" + s.srcName for s in self.classes]
+        write_editor_configs(self.output, root, sources, angle_includes(self.templates.texts["includes"]))
+
+
+def render_includes(templates: Templates, groups: dict[str, list[str]], delegates: str, enums_text: str) -> str:
+    """includes.h out of the headers of every group (directory) and the rendered delegates"""
+    groups = "".join(
+        [
+            templates.include_group(name=path, includes="".join([templates.include(path=n) for n in names]))
+            for path, names in sorted(list(groups.items()), key=lambda x: x[0])
+        ]
+    )
+    return finish(
+        templates.includes(
+            macros=macros(),
+            gd_namespace=gd_namespace(),
+            groups=groups,
+            delegates=delegates,
+            enums=enums_text,
+        )
+    )
+
+
+def concat_bindings(bindings: Union[str, Path] = ".temp", cache: Union[str, Path] = CONCAT_CACHE) -> bytes:
+    """Glues all the broma files together into one file for pybroma to parse"""
+    _dir = Path(bindings)
+    code = b""
+    for name in BINDINGS_FILES:
+        code += open(_dir / name, "rb").read() + b"\n"
+
+    # Other runs sharing the work directory could be parsing it right now...
+    atomic_write(cache, code)
+    return code
+
+
+def write_everything(path:Path = None, output: Output = None, profiler: Profiler = None, bindings: Union[str, Path] = ".temp", symbols: Union[str, Path] = None, templates: Templates = None, work_dir: Union[str, Path] = ".", categories: dict[ClassType, str] = None, parser: str = None, addresses: Union[str, Path] = None, shard: tuple[int, int] = None, root: Union[str, Path] = None, editor_configs: bool = True):
+    """Builds the whole decomp tree, by default it's staged and then moved into
+    `path` (the current directory if not given) but any other `Output` backend
+    can be handed over instead. If `symbols` is given a sqlite index of
+    everything is made there as well and if `addresses` is given the address
+    tables are saved there and written into headers/addresses.h. The
+    concatenated bindings and the model cache are kept in `work_dir`. `parser`
+    picks pybroma or the built-in parser, pybroma if it's installed by default.
+    With `shard` (index, count) only the classes of that shard are written along
+    with a manifest instead of includes.h, see `merge_shards`. `root` is where
+    the tree ends up for the absolute paths of compile_commands.json, `path`
+    by default. Without `editor_configs` those are left out, for trees that
+    don't end up on this machine or that get them later..."""
+    if output is None:
+        with open_output(path, staged=True) as output:
+            return write_everything(path, output, profiler=profiler, bindings=bindings, symbols=symbols, templates=templates, work_dir=work_dir, categories=categories, parser=parser, addresses=addresses, shard=shard, root=root, editor_configs=editor_configs)
+
+    if profiler is None:
+        profiler = Profiler()
+
+    with profiler.phase("concat"):
+        code = concat_bindings(bindings, Path(work_dir) / CONCAT_CACHE)
+    profiler.count("bindings_bytes", len(code))
+
+    with profiler.phase("parse"):
+        classes = parse_bindings(Path(work_dir) / CONCAT_CACHE, parser)
+    # Keep the model around so that `generate` doesn't need to parse anything...
+    with profiler.phase("model"):
+        save_model(classes, Path(work_dir) / MODEL_CACHE)
+
+    only = None
+    if shard is not None:
+        only = {c.name for c in classes if shard_of(c.name, shard[1]) == shard[0]}
+
+    index = SymbolIndex(symbols) if symbols else None
+    address_index = AddressIndex(addresses) if addresses else None
+    chw = ClassHeadersWriter(output, only, index=index, templates=templates, categories=categories, addresses=address_index)
+    with profiler.phase("visit"):
+        chw.start(classes)
+    if index is not None:
+        with profiler.phase("symbols"):
+            index.close()
+    if address_index is not None:
+        with profiler.phase("addresses"):
+            address_index.close()
+            chw.write_addresses()
+    with profiler.phase("sources"):
+        chw.write_sources()
+    if shard is not None:
+        with profiler.phase("manifest"):
+            output.write(SHARD_MANIFEST, json.dumps(chw.shard_manifest(classes, shard, code, Path(bindings) / ENUMS_FILE)))
+    else:
+        with profiler.phase("includes"):
+            chw.write_includes(Path(bindings) / ENUMS_FILE)
+
+        if editor_configs:
+            with profiler.phase("vscode"):
+                chw.write_vscode_header(root or path or ".")
+
+    profiler.count("classes", len(chw.classes))
+    profiler.count("delegates", len(chw.delegates))
+    profiler.count("files_written", output.files_written)
+    profiler.count("bytes_written", output.bytes_written)
+
+
+def merge_shards(shards: list[Union[str, Path]], path: Path = None, output: Output = None, templates: Templates = None, profiler: Profiler = None, root: Union[str, Path] = None, editor_configs: bool = True) -> int:
+    """Puts the outputs of every `write_everything(shard=...)` together into one
+    tree, the headers and sources are copied over as they are and includes.h is
+    made out of the manifests. Returns how many classes were merged"""
+    if output is None:
+        with open_output(path, staged=True) as output:
+            return merge_shards(shards, path, output, templates=templates, profiler=profiler, root=root, editor_configs=editor_configs)
+
+    if profiler is None:
+        profiler = Profiler()
+    templates = templates if templates is not None else DEFAULT_TEMPLATES
+    # Where the merged tree ends up, `root` is taken by the shard directories below
+    tree = root or path or "."
+
+    with profiler.phase("manifests"):
+        manifests = load_manifests(shards)
+    classes = [(root, c) for root, m in manifests for c in m["classes"]]
+
+    with profiler.phase("copy"):
+        output.plan({"headers"} | {f.rpartition("/")[0] for _, c in classes for f in c["files"]})
+        for root, c in classes:
+            for name in c["files"]:
+                output.write(name, (root / name).read_bytes().decode("utf-8"))
+
+    with profiler.phase("includes"):
+        groups: dict[str, list[str]] = {g: [] for _, m in manifests for g in m["groups"]}
+        for _, c in sorted(classes, key=lambda rc: rc[1]["order"]):
+            groups[c["group"]].append(c["include"])
+        delegates = "".join(d["text"] for d in sorted((d for _, m in manifests for d in m["delegates"]), key=lambda d: d["order"]))
+        output.write("headers/includes.h", render_includes(templates, groups, delegates, manifests[0][1]["enums"]))
+
+    if editor_configs:
+        with profiler.phase("vscode"):
+            sources = [f for _, c in classes for f in c["files"] if f.startswith("src/")]
+            write_editor_configs(output, tree, sources, angle_includes(templates.texts["includes"]))
+
+    profiler.count("classes", len(classes))
+    profiler.count("files_written", output.files_written)
+    profiler.count("bytes_written", output.bytes_written)
+    return len(classes)
+
+
+def superclass_chain(classes: list[Class], names: list[str]) -> set[str]:
+    """Every class in `names` along with all of the classes it inherits from"""
+    classes = {c.name: c for c in classes}
+    chain = set()
+    todo = list(names)
+    while todo:
+        name = todo.pop()
+        if name in chain:
+            continue
+        chain.add(name)
+        if cls := classes.get(name):
+            todo.extend(cls.superclasses)
+    return chain
+
+
+def write_classes(names: list[str], output: Output = None, superclasses: bool = False, cache: Union[str, Path] = MODEL_CACHE, templates: Templates = None, categories: dict[ClassType, str] = None):
+    """Writes the header and source of only the given classes using the model
+    that was cached by the last `write_everything`, nothing else is touched
+    (includes.h is left alone). Returns the classes that were written..."""
+    if output is None:
+        with DirectoryOutput() as output:
+            return write_classes(names, output, superclasses, cache, templates, categories)
+
+    if not Path(cache).exists():
+        raise FileNotFoundError(f"{cache} is missing, the whole environment needs to be built at least once first")
+
+    classes = load_model(cache)
+    chw = ClassHeadersWriter(output, superclass_chain(classes, names) if superclasses else set(names), templates=templates, categories=categories)
+    chw.start(classes)
+    chw.write_sources()
+    return [s.cppCls.name for s in chw.classes]